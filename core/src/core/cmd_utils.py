@@ -1,4 +1,5 @@
 import argparse
+import os
 from dataclasses import is_dataclass
 from pathlib import Path
 from typing import Final, Sequence, TypeVar
@@ -88,3 +89,47 @@ def load_app_settings(
     return _load_app_settings(
         dataclass_type, config_path=args.config, env_path=args.env
     )
+
+
+def load_app_settings_from_env(
+    dataclass_type: type[T],
+    *,
+    config_var: str = "APP_CONFIG",
+    env_file_var: str = "APP_ENV_FILE",
+) -> T:
+    """Load settings for app factories started by a process manager instead of the CLI.
+
+    The YAML path is read from ``config_var`` and an optional env file from ``env_file_var``,
+    mirroring the ``--config`` and ``--env`` arguments of :func:`load_app_settings`.
+    """
+
+    config_path = os.environ.get(config_var)
+    if not config_path:
+        msg = f"Set {config_var} to the path of the YAML configuration file."
+        raise RuntimeError(msg)
+    if not is_dataclass(dataclass_type):
+        msg = f"Expected a dataclass type, got {dataclass_type!r}"
+        raise TypeError(msg)
+    return _load_app_settings(
+        dataclass_type,
+        config_path=config_path,
+        env_path=os.environ.get(env_file_var) or None,
+    )
+
+
+def export_app_settings_env(
+    argv: Sequence[str] | None = None,
+    *,
+    config_var: str = "APP_CONFIG",
+    env_file_var: str = "APP_ENV_FILE",
+) -> None:
+    """Expose the CLI ``--config``/``--env`` paths to worker processes via the environment.
+
+    Worker processes started by the server re-load settings with
+    :func:`load_app_settings_from_env`, which reads these variables.
+    """
+
+    args = _parse_args(argv)
+    os.environ[config_var] = str(args.config)
+    if args.env is not None:
+        os.environ[env_file_var] = str(args.env)
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from core.cmd_utils import load_app_settings_from_env
 from core.settings import load_dataclass_from_yaml
 
 
@@ -83,3 +84,32 @@ def test_non_mapping_for_nested_field_errors(tmp_path):
 
     with pytest.raises(TypeError):
         load_dataclass_from_yaml(AppConfig, yaml_path)
+
+
+def test_load_app_settings_from_env_reads_config_path(tmp_path, monkeypatch):
+    yaml_path = write_yaml(
+        tmp_path / "config.yaml",
+        """
+        database:
+          host: api.internal
+          port: 5432
+          credentials:
+            username: user
+            password: pass
+        """,
+    )
+
+    monkeypatch.setenv("APP_CONFIG", str(yaml_path))
+    monkeypatch.delenv("APP_ENV_FILE", raising=False)
+
+    config = load_app_settings_from_env(AppConfig)
+
+    assert config.database.port == 5432
+    assert config.database.credentials.username == "user"
+
+
+def test_load_app_settings_from_env_requires_config_path(monkeypatch):
+    monkeypatch.delenv("APP_CONFIG", raising=False)
+
+    with pytest.raises(RuntimeError, match="APP_CONFIG"):
+        load_app_settings_from_env(AppConfig)
@@ -0,0 +1,19 @@
+"""Gunicorn settings for running the documents service.
+
+Usage, from the ``documents`` directory::
+
+    APP_CONFIG=src/documents/configs/local.yaml gunicorn
+
+``WEB_CONCURRENCY`` overrides the worker count and ``BIND`` the listen address.
+"""
+
+import os
+
+wsgi_app = "documents.app:application()"
+worker_class = "uvicorn_worker.UvicornWorker"
+# Each worker process holds its own in-memory vector index, so with several workers a document
+# is only searchable (and deletable) in the worker that indexed it. Keep a single worker until
+# the vector store is shared between processes (persisted or external); CPU-bound extraction
+# already fans out through the ingest and page-extraction pools.
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+bind = os.environ.get("BIND", "0.0.0.0:8080")
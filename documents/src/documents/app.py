@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import asyncio
 import dataclasses
+import sys
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from typing import Final, TypeVar
 
 import pydantic.dataclasses as pydantic_dataclasses
 import structlog
 import uvicorn
-from core.cmd_utils import load_app_settings
+from core.cmd_utils import load_app_settings, load_app_settings_from_env
 from core.logging import configure_logging
 from core.settings import CoreSettings
 from core.telemetry import configure_tracing
@@ -18,10 +21,19 @@ from fastapi import FastAPI
 from documents.dependencies import configure_document_dependencies
 from documents.routers.indexing import create_indexing_router
 from documents.routers.search import create_search_router
+from documents.services.pdf_ingestion import (
+    PdfIndexingQueue,
+    init_ingest_worker,
+    shutdown_page_pool,
+    start_page_pool,
+)
 from documents.services.settings import DocumentSettings
 
 LOGGER: Final = structlog.get_logger(__name__)
 
+# uvloop is Unix-only.
+_EVENT_LOOP: Final = "asyncio" if sys.platform == "win32" else "uvloop"
+
 _SettingsT = TypeVar("_SettingsT")
 
 
@@ -37,14 +49,42 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
     if settings is None:
         settings = AppSettings()
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Runs in every server process, so each worker builds its own index service.
+        configure_document_dependencies(settings.documents)
+        ingest_workers = settings.documents.ingest_workers
+        app.state.ingest_pool = (
+            ProcessPoolExecutor(max_workers=ingest_workers, initializer=init_ingest_worker)
+            if ingest_workers > 0
+            else None
+        )
+        if app.state.ingest_pool is None:
+            # Ingest workers extract their PDF serially, so the page pool only runs without them.
+            start_page_pool(settings.documents.extraction)
+        app.state.pdf_index_queue = None
+        if settings.documents.index_batch_window_ms > 0:
+            app.state.pdf_index_queue = PdfIndexingQueue(
+                document_settings=settings.documents,
+                executor=app.state.ingest_pool,
+            )
+            app.state.pdf_index_queue.start()
+        try:
+            yield
+        finally:
+            if app.state.pdf_index_queue is not None:
+                await app.state.pdf_index_queue.stop()
+            if app.state.ingest_pool is not None:
+                app.state.ingest_pool.shutdown(wait=True, cancel_futures=True)
+            shutdown_page_pool()
+
     app = FastAPI(
         title=settings.title,
         description=settings.description,
         version=settings.version,
+        lifespan=lifespan,
     )
 
-    configure_document_dependencies(settings.documents)
-
     indexing_router = create_indexing_router(settings.documents)
     app.include_router(indexing_router)
 
@@ -55,8 +95,19 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
     return app
 
 
+def application() -> FastAPI:
+    """App factory for process managers, configured from ``APP_CONFIG``/``APP_ENV_FILE``.
+
+    See ``gunicorn.conf.py``; the in-memory index limits it to one worker.
+    """
+
+    settings: AppSettings = load_app_settings_from_env(AppSettings)
+    configure_logging(settings.logging)
+    return create_app(settings)
+
+
 def serve() -> None:
-    """Run the documents service with Uvicorn."""
+    """Run the documents service with a single Uvicorn process (development)."""
 
     settings: AppSettings = load_app_settings(AppSettings, None)
     configure_logging(settings.logging)
@@ -69,9 +120,16 @@ def serve() -> None:
         host=settings.host,
         port=settings.port,
         reload=False,
+        loop=_EVENT_LOOP,
+        http="httptools",
+        # Logging is configured by configure_logging; skip uvicorn's dictConfig and the
+        # per-request access log line.
+        log_config=None,
+        access_log=False,
     )
     server = uvicorn.Server(config=config)
-    asyncio.run(server.serve())
+    # Server.run() builds the event loop from ``config.loop``; serve() would inherit asyncio's.
+    server.run()
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from fastapi import (
     File,
     Form,
     HTTPException,
+    Request,
     UploadFile,
     status,
 )
@@ -16,7 +17,12 @@ from fastapi import (
 from documents.dependencies import get_document_index_service
 from documents.schemas import DocumentUploadResponse, IndexDocumentsRequest, IndexDocumentsResponse
 from documents.services.indexing_service import DocumentIndexService
-from documents.services.pdf_ingestion import DocumentsStore, process_pdf_for_indexing
+from documents.services.pdf_ingestion import (
+    DocumentsStore,
+    PdfIndexingQueue,
+    PdfIndexJob,
+    process_pdf_for_indexing,
+)
 from documents.services.settings import DocumentSettings
 
 
@@ -46,6 +52,7 @@ def create_indexing_router(document_settings: DocumentSettings) -> APIRouter:
         summary="Upload a PDF for asynchronous indexing",
     )
     async def index_pdf_document(
+        request: Request,
         background_tasks: BackgroundTasks,
         service: ServiceDependency,
         file: UploadFileDependency,
@@ -66,14 +73,24 @@ def create_indexing_router(document_settings: DocumentSettings) -> APIRouter:
         except ValueError as exc:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-        background_tasks.add_task(
-            process_pdf_for_indexing,
-            file_path,
-            document_id=resolved_id,
-            service=service,
-            original_filename=file.filename,
-            document_settings=document_settings,
-        )
+        index_queue: PdfIndexingQueue | None = request.app.state.pdf_index_queue
+        if index_queue is not None:
+            job = PdfIndexJob(
+                file_path=file_path,
+                document_id=resolved_id,
+                original_filename=file.filename,
+            )
+            index_queue.submit(job, service)
+        else:
+            background_tasks.add_task(
+                process_pdf_for_indexing,
+                file_path,
+                document_id=resolved_id,
+                service=service,
+                original_filename=file.filename,
+                document_settings=document_settings,
+                executor=request.app.state.ingest_pool,
+            )
 
         return DocumentUploadResponse(
             document_id=resolved_id,
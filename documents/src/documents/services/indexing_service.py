@@ -27,8 +27,24 @@ class DocumentIndexService:
         self._embed_model = HuggingFaceEmbedding(model_name=settings.embed.model_name)
         Settings.embed_model = self._embed_model
 
-    def index_documents(self, documents: Iterable[DocumentPayload]) -> int:
-        """Persist the provided documents in-memory and rebuild the index."""
+    def index_documents(
+        self,
+        documents: Iterable[DocumentPayload],
+        *,
+        replace_document_ids: Iterable[str] = (),
+    ) -> int:
+        """Persist the provided documents in-memory and rebuild the index.
+
+        Entries stored for ``replace_document_ids`` (the id itself and its ``<id>:<chunk>``
+        chunks) are dropped first, so re-indexing a document never leaves stale chunks behind.
+        """
+
+        prefixes = tuple(f"{document_id}:" for document_id in replace_document_ids)
+        if prefixes:
+            replaced = {prefix[:-1] for prefix in prefixes}
+            for stored_id in list(self._documents):
+                if stored_id in replaced or stored_id.startswith(prefixes):
+                    del self._documents[stored_id]
 
         for payload in documents:
             self._documents[payload.document_id] = payload
@@ -2,21 +2,46 @@
 
 from __future__ import annotations
 
+import asyncio
+import errno
+import io
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Final
 from uuid import uuid4
 
+import aiofiles
 import pydantic.dataclasses as pydantic_dataclasses
+import pymupdf
 import structlog
 from fastapi import UploadFile
 from pypdf import PdfReader
 
 from documents.schemas import DocumentPayload
 from documents.services.indexing_service import DocumentIndexService
-from documents.services.settings import DocumentSettings
+from documents.services.pdf_pages import extract_page_range, extract_pages, open_pdf
+from documents.services.settings import DocumentSettings, PdfExtractionSettings
 
 LOGGER: Final = structlog.get_logger(__name__)
 
+_UPLOAD_CHUNK_BYTES: Final = 1 << 20
+
+# ``sendfile`` into a regular file is unsupported on some platforms (e.g. macOS needs a socket).
+_SENDFILE_UNSUPPORTED: Final = frozenset(
+    {errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP}
+)
+
+# Separators tried in order when splitting extracted text: paragraphs, lines, sentences, words.
+_CHUNK_SEPARATORS: Final = ("\n\n", "\n", ". ", " ")
+
+# Process-wide page extraction pool, owned by the app lifespan (``start_page_pool`` and
+# ``shutdown_page_pool``); PDFs are extracted in-process while it is unset.
+_PAGE_POOL: Final[dict[str, ProcessPoolExecutor | None]] = {"pool": None}
+
 
 @pydantic_dataclasses.dataclass(frozen=True)
 class DocumentsStore:
@@ -45,64 +70,434 @@ class DocumentsStore:
         original_suffix = Path(upload.filename or "").suffix or ".pdf"
         target_path = destination_dir / f"{doc_id}{original_suffix}"
 
-        content = await upload.read()
-        if not content:
+        try:
+            await self._stream_to_disk(upload, target_path)
+        except BaseException:
+            target_path.unlink(missing_ok=True)
+            raise
+        finally:
+            await upload.close()
+
+        return doc_id, target_path
+
+    async def _stream_to_disk(self, upload: UploadFile, target_path: Path) -> None:
+        """Copy the upload to ``target_path`` without holding the whole file in memory.
+
+        Uploads that Starlette already spooled to a temporary file are copied in-kernel with
+        ``sendfile``; everything else is streamed in fixed-size chunks.
+        """
+
+        source = _spooled_source(upload)
+        if source is not None:
+            fd, offset, size = source
+            self._check_upload_size(size)
+            try:
+                await asyncio.to_thread(_sendfile_to_path, fd, offset, size, target_path)
+                return
+            except OSError as exc:
+                if exc.errno not in _SENDFILE_UNSUPPORTED:
+                    raise
+            await upload.seek(offset)
+
+        max_bytes = self.settings.max_upload_mb * 1024 * 1024
+        total_bytes = 0
+        async with aiofiles.open(target_path, "wb") as out:
+            while chunk := await upload.read(_UPLOAD_CHUNK_BYTES):
+                total_bytes += len(chunk)
+                if total_bytes > max_bytes:
+                    self._check_upload_size(total_bytes)
+                await out.write(chunk)
+
+        self._check_upload_size(total_bytes)
+
+    def _check_upload_size(self, size: int) -> None:
+        if size > self.settings.max_upload_mb * 1024 * 1024:
+            raise ValueError(f"Uploaded PDF exceeds the {self.settings.max_upload_mb} MiB limit.")
+        if size == 0:
             raise ValueError("Uploaded PDF is empty.")
 
-        target_path.write_bytes(content)
-        await upload.close()
 
-        return doc_id, target_path
+def _spooled_source(upload: UploadFile) -> tuple[int, int, int] | None:
+    """Return ``(fd, offset, remaining_bytes)`` when the upload is backed by a file on disk."""
+
+    file = upload.file
+    # An in-memory ``SpooledTemporaryFile`` rolls over to disk on ``fileno()``; Starlette only
+    # keeps uploads under its 1 MiB spool limit in memory, so that copy stays small.
+    try:
+        file.flush()
+        fd = file.fileno()
+        offset = file.tell()
+        size = os.fstat(fd).st_size
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+    return fd, offset, max(0, size - offset)
+
+
+def _sendfile_to_path(in_fd: int, offset: int, count: int, target_path: Path) -> None:
+    out_fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while count > 0:
+            sent = os.sendfile(out_fd, in_fd, offset, count)
+            if sent == 0:
+                break
+            offset += sent
+            count -= sent
+    finally:
+        os.close(out_fd)
 
 
-def process_pdf_for_indexing(
+@dataclass(frozen=True, slots=True)
+class PdfIndexJob:
+    """A persisted PDF upload waiting to be extracted and indexed."""
+
+    file_path: Path
+    document_id: str
+    original_filename: str | None = None
+
+
+async def process_pdf_for_indexing(
     file_path: Path,
     *,
     document_id: str,
     service: DocumentIndexService,
     original_filename: str | None,
     document_settings: DocumentSettings,
+    executor: Executor | None = None,
 ) -> None:
     """Extract content from the PDF and index it with the provided service."""
 
-    extracted_text = extract_text_from_pdf(file_path)
-    if not extracted_text:
-        LOGGER.warning("No text extracted from %s", file_path)
-        return
+    job = PdfIndexJob(
+        file_path=file_path,
+        document_id=document_id,
+        original_filename=original_filename,
+    )
+    await process_pdfs_for_indexing(
+        [job],
+        service=service,
+        document_settings=document_settings,
+        executor=executor,
+    )
 
-    metadata_base = {
-        "source_path": str(file_path),
+
+async def process_pdfs_for_indexing(
+    jobs: Sequence[PdfIndexJob],
+    *,
+    service: DocumentIndexService,
+    document_settings: DocumentSettings,
+    executor: Executor | None = None,
+) -> int:
+    """Extract every PDF in ``jobs`` and index the results in batches.
+
+    Extraction runs concurrently on ``executor`` (the default thread pool when ``None``) and
+    indexing runs in a worker thread, so neither blocks the event loop. Each PDF is split into
+    chunk payloads that are flushed to ``service.index_documents`` every ``index_batch_size``
+    payloads. Returns the number of payloads handed to the service.
+    """
+
+    loop = asyncio.get_running_loop()
+    extract = partial(extract_pdf_content, settings=document_settings.extraction)
+    extracted = await asyncio.gather(
+        *(loop.run_in_executor(executor, extract, job.file_path) for job in jobs),
+        return_exceptions=True,
+    )
+
+    batch_size = max(1, document_settings.index_batch_size)
+    batch: list[DocumentPayload] = []
+    # A document's chunks always land in one batch, which also replaces its earlier chunks.
+    batch_document_ids: list[str] = []
+    indexed_count = 0
+    for job, content in zip(jobs, extracted, strict=True):
+        if isinstance(content, BaseException):
+            LOGGER.error("Failed to extract %s: %s", job.file_path, content)
+            continue
+        if not content.text:
+            LOGGER.warning("No text extracted from %s", job.file_path)
+            continue
+
+        batch.extend(_build_payloads(job, content, document_settings))
+        batch_document_ids.append(job.document_id)
+        if len(batch) >= batch_size:
+            indexed_count += await _index_batch(service, batch, batch_document_ids)
+            batch = []
+            batch_document_ids = []
+
+    if batch:
+        indexed_count += await _index_batch(service, batch, batch_document_ids)
+    return indexed_count
+
+
+def _build_payloads(
+    job: PdfIndexJob,
+    content: PdfContent,
+    document_settings: DocumentSettings,
+) -> list[DocumentPayload]:
+    metadata_base: dict[str, object] = {
+        "source_path": str(job.file_path),
+        "page_count": content.page_count,
     }
-    if original_filename:
-        metadata_base["original_filename"] = original_filename
+    if job.original_filename:
+        metadata_base["original_filename"] = job.original_filename
 
-    payloads = [
+    chunks = _split_text(
+        content.text,
+        max_chars=document_settings.chunk_max_chars,
+        overlap=document_settings.chunk_overlap_chars,
+    )
+    return [
         DocumentPayload(
-            document_id=document_id,
-            content=extracted_text,
-            metadata=metadata_base,
+            document_id=f"{job.document_id}:{chunk_index}",
+            content=chunk,
+            metadata={**metadata_base, "chunk_index": chunk_index},
         )
+        for chunk_index, chunk in enumerate(chunks)
     ]
 
+
+def _split_text(text: str, max_chars: int = 1200, overlap: int = 120) -> list[str]:
+    """Split ``text`` into chunks of at most ``max_chars`` sharing about ``overlap`` chars.
+
+    Text is cut on the coarsest separator that yields small enough pieces (paragraphs, then
+    lines, sentences and words) and the pieces are greedily merged back into chunks.
+    """
+
+    max_chars = max(1, max_chars)
+    pieces = _split_pieces(text.strip(), max_chars, _CHUNK_SEPARATORS)
+
+    chunks: list[str] = []
+    window: list[str] = []
+    window_chars = 0
+    for piece in pieces:
+        if window and window_chars + len(piece) > max_chars:
+            chunks.append("".join(window).strip())
+            # Keep trailing pieces as overlap for the next chunk while they still fit.
+            while window and (window_chars > overlap or window_chars + len(piece) > max_chars):
+                window_chars -= len(window.pop(0))
+        window.append(piece)
+        window_chars += len(piece)
+    if window:
+        chunks.append("".join(window).strip())
+
+    return [chunk for chunk in chunks if chunk]
+
+
+def _split_pieces(text: str, max_chars: int, separators: Sequence[str]) -> list[str]:
+    if len(text) <= max_chars:
+        return [text] if text else []
+
+    for index, separator in enumerate(separators):
+        if separator not in text:
+            continue
+        parts = text.split(separator)
+        pieces: list[str] = []
+        for part_index, part in enumerate(parts):
+            if part_index < len(parts) - 1:
+                part += separator
+            pieces.extend(_split_pieces(part, max_chars, separators[index + 1 :]))
+        return pieces
+
+    return [text[start : start + max_chars] for start in range(0, len(text), max_chars)]
+
+
+async def _index_batch(
+    service: DocumentIndexService,
+    payloads: list[DocumentPayload],
+    replace_document_ids: list[str],
+) -> int:
+    document_ids = [payload.document_id for payload in payloads]
     try:
-        service.index_documents(payloads)
-        LOGGER.info(
-            "Indexed PDF document %s from %s",
-            document_id,
-            file_path,
+        await asyncio.to_thread(
+            partial(service.index_documents, payloads, replace_document_ids=replace_document_ids)
         )
     except Exception as exc:  # pragma: no cover - defensive logging
-        LOGGER.exception("Failed to index document %s: %s", document_id, exc)
+        LOGGER.exception("Failed to index documents %s: %s", document_ids, exc)
+        return 0
+
+    LOGGER.info("Indexed PDF documents %s", document_ids)
+    return len(payloads)
+
+
+class PdfIndexingQueue:
+    """Coalesce PDF uploads arriving within a short window into one indexing pass."""
+
+    def __init__(
+        self,
+        *,
+        document_settings: DocumentSettings,
+        executor: Executor | None = None,
+    ) -> None:
+        self._settings = document_settings
+        self._executor = executor
+        self._queue: asyncio.Queue[tuple[PdfIndexJob, DocumentIndexService] | None] = (
+            asyncio.Queue()
+        )
+        self._consumer: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        self._consumer = asyncio.create_task(self._consume())
+
+    async def stop(self) -> None:
+        """Flush queued uploads and stop the consumer task."""
+
+        if self._consumer is None:
+            return
+        self._queue.put_nowait(None)
+        await self._consumer
+        self._consumer = None
+
+    def submit(self, job: PdfIndexJob, service: DocumentIndexService) -> None:
+        self._queue.put_nowait((job, service))
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        window_seconds = self._settings.index_batch_window_ms / 1000
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
 
+            pending = [item]
+            stopping = False
+            deadline = loop.time() + window_seconds
+            while len(pending) < self._settings.index_batch_size:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
 
-def extract_text_from_pdf(file_path: Path) -> str:
+            await self._flush(pending)
+            if stopping:
+                return
+
+    async def _flush(self, pending: list[tuple[PdfIndexJob, DocumentIndexService]]) -> None:
+        jobs_by_service: dict[int, tuple[DocumentIndexService, list[PdfIndexJob]]] = {}
+        for job, service in pending:
+            jobs_by_service.setdefault(id(service), (service, []))[1].append(job)
+
+        for service, jobs in jobs_by_service.values():
+            try:
+                await process_pdfs_for_indexing(
+                    jobs,
+                    service=service,
+                    document_settings=self._settings,
+                    executor=self._executor,
+                )
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.exception("Failed to process queued PDFs: %s", exc)
+
+
+@dataclass(frozen=True, slots=True)
+class PdfContent:
+    """Text and document-level details read from a single PDF parse."""
+
+    text: str
+    page_count: int
+
+
+def extract_pdf_content(
+    file_path: Path,
+    *,
+    settings: PdfExtractionSettings | None = None,
+) -> PdfContent:
+    """Extract plain text and the page count from a PDF file."""
+
+    settings = settings or PdfExtractionSettings()
+    if settings.backend == "pypdf":
+        return _extract_content_with_pypdf(file_path)
+
+    try:
+        with open_pdf(file_path) as document:
+            page_count = document.page_count
+            workers = _extraction_workers(settings, page_count)
+            if workers <= 1:
+                pages = extract_pages(document, range(page_count), settings.dense_stream_bytes)
+                text = _join_pages(pages)
+                return PdfContent(text=text, page_count=page_count)
+    except (pymupdf.FileDataError, RuntimeError, OSError) as exc:
+        LOGGER.exception("Failed to read PDF %s: %s", file_path, exc)
+        return PdfContent(text="", page_count=0)
+
+    text = _extract_pages_in_parallel(file_path, page_count, workers, settings)
+    return PdfContent(text=text, page_count=page_count)
+
+
+def extract_text_from_pdf(
+    file_path: Path,
+    *,
+    settings: PdfExtractionSettings | None = None,
+) -> str:
     """Extract plain text from a PDF file."""
 
+    return extract_pdf_content(file_path, settings=settings).text
+
+
+def _extract_pages_in_parallel(
+    file_path: Path, page_count: int, workers: int, settings: PdfExtractionSettings
+) -> str:
+    # Pages are independent, so contiguous page ranges are extracted in separate processes
+    # and stitched back together in page order; ``workers`` ranges bound this PDF's share.
+    step = -(-page_count // workers)
+    starts = range(0, page_count, step)
+    stops = [min(start + step, page_count) for start in starts]
+    extract = partial(
+        extract_page_range, str(file_path), dense_stream_bytes=settings.dense_stream_bytes
+    )
+    pool = _PAGE_POOL["pool"]
+    if pool is None:
+        raise RuntimeError("The page extraction pool has been shut down.")
+    page_groups = pool.map(extract, starts, stops)
+    return _join_pages(text for group in page_groups for text in group)
+
+
+def start_page_pool(settings: PdfExtractionSettings) -> None:
+    """Start the shared page extraction pool with ``settings.workers`` processes.
+
+    Worker start-up (a fresh interpreter importing PyMuPDF) costs far more than extracting a
+    typical PDF, so one pool serves every upload; each PDF submits as many page ranges as its
+    size warrants.
+    """
+
+    workers = min(settings.workers, os.cpu_count() or 1)
+    if workers > 1 and _PAGE_POOL["pool"] is None:
+        _PAGE_POOL["pool"] = ProcessPoolExecutor(max_workers=workers)
+
+
+def shutdown_page_pool() -> None:
+    pool, _PAGE_POOL["pool"] = _PAGE_POOL["pool"], None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def init_ingest_worker() -> None:
+    """``ProcessPoolExecutor`` initializer for the ingest pool.
+
+    The ingest pool already runs one PDF per process, so its workers extract pages serially
+    and never touch a page pool inherited from the parent.
+    """
+
+    _PAGE_POOL["pool"] = None
+
+
+def _extraction_workers(settings: PdfExtractionSettings, page_count: int) -> int:
+    if _PAGE_POOL["pool"] is None:
+        return 1
+    by_pages = page_count // max(1, settings.min_pages_per_worker)
+    return min(settings.workers, os.cpu_count() or 1, by_pages)
+
+
+def _join_pages(texts: Iterable[str]) -> str:
+    return "\n".join(text for text in texts if text).strip()
+
+
+def _extract_content_with_pypdf(file_path: Path) -> PdfContent:
     try:
         reader = PdfReader(str(file_path))
     except Exception as exc:  # pragma: no cover - defensive logging
         LOGGER.exception("Failed to read PDF %s: %s", file_path, exc)
-        return ""
+        return PdfContent(text="", page_count=0)
 
     chunks: list[str] = []
     for page in reader.pages:
@@ -114,4 +509,4 @@ def extract_text_from_pdf(file_path: Path) -> str:
         if text:
             chunks.append(text)
 
-    return "\n".join(chunks).strip()
+    return PdfContent(text="\n".join(chunks).strip(), page_count=len(reader.pages))
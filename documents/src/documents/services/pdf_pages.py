@@ -0,0 +1,72 @@
+"""Page-level PyMuPDF text extraction.
+
+Kept apart from ``pdf_ingestion`` so extraction worker processes only import PyMuPDF, not the
+indexing stack (llama_index, embedding models) that ``pdf_ingestion`` pulls in.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Final
+
+import pymupdf
+import structlog
+
+LOGGER: Final = structlog.get_logger(__name__)
+
+# Plain "text" output only needs glyph runs: no image blocks, vector collection or per-char
+# bookkeeping such as ligature/CID preservation, all of which are wasted on drawing-heavy pages.
+_TEXT_ONLY_FLAGS: Final = pymupdf.TEXT_PRESERVE_WHITESPACE | pymupdf.TEXT_MEDIABOX_CLIP
+
+# On pages with very large content streams (figures, plots, scanned overlays) only text blocks
+# longer than this are kept; short fragments there are mostly axis labels and legends.
+_DENSE_PAGE_MIN_BLOCK_CHARS: Final = 16
+_TEXT_BLOCK: Final = 0
+
+
+@contextmanager
+def open_pdf(file_path: Path) -> Iterator[pymupdf.Document]:
+    """Open ``file_path`` once so text, page count and metadata share one parsed document."""
+
+    document = pymupdf.open(str(file_path))
+    try:
+        yield document
+    finally:
+        document.close()
+
+
+def extract_page_range(path: str, start: int, stop: int, *, dense_stream_bytes: int) -> list[str]:
+    """Extract pages ``[start, stop)`` of ``path``; runs inside a worker process."""
+
+    with open_pdf(Path(path)) as document:
+        return extract_pages(document, range(start, stop), dense_stream_bytes)
+
+
+def extract_pages(
+    document: pymupdf.Document, page_numbers: Iterable[int], dense_stream_bytes: int
+) -> list[str]:
+    texts: list[str] = []
+    for page_number in page_numbers:
+        try:
+            texts.append(_page_text(document[page_number], dense_stream_bytes))
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning(
+                "Failed to extract text from page %s in %s: %s", page_number, document.name, exc
+            )
+    return texts
+
+
+def _page_text(page: pymupdf.Page, dense_stream_bytes: int) -> str:
+    """Return the page text, keeping only substantial text blocks on drawing-heavy pages."""
+
+    if dense_stream_bytes <= 0 or len(page.read_contents()) <= dense_stream_bytes:
+        return page.get_text("text", flags=_TEXT_ONLY_FLAGS) or ""
+
+    blocks = page.get_text("blocks", flags=_TEXT_ONLY_FLAGS)
+    return "".join(
+        block[4]
+        for block in blocks
+        if block[6] == _TEXT_BLOCK and len(block[4].strip()) > _DENSE_PAGE_MIN_BLOCK_CHARS
+    )
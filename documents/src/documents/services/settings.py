@@ -1,3 +1,5 @@
+from typing import Literal
+
 import pydantic.dataclasses as pydantic_dataclasses
 
 
@@ -18,8 +20,23 @@ class EmbedSettings:
     chunk_size: int = 384  # may use llamaindex's default instead
 
 
+@pydantic_dataclasses.dataclass(frozen=True)
+class PdfExtractionSettings:
+    backend: Literal["pymupdf", "pypdf"] = "pymupdf"
+    workers: int = 4  # processes used for page extraction; capped at the CPU count
+    min_pages_per_worker: int = 8  # smaller PDFs are extracted in-process
+    dense_stream_bytes: int = 512_000  # larger page content streams keep only text blocks
+
+
 @pydantic_dataclasses.dataclass(frozen=True)
 class DocumentSettings:
     store: ObjectStoreSettings = ObjectStoreSettings()
     summary_model_name: str = "openai/gpt-4o-mini"
     embed: EmbedSettings = EmbedSettings()
+    extraction: PdfExtractionSettings = PdfExtractionSettings()
+    max_upload_mb: int = 64
+    ingest_workers: int = 0  # processes for PDF extraction; 0 uses the default thread pool
+    index_batch_size: int = 100
+    chunk_max_chars: int = 1200  # roughly 300 tokens per indexed chunk
+    chunk_overlap_chars: int = 120
+    index_batch_window_ms: int = 0  # >0 coalesces uploads arriving within the window
@@ -16,12 +16,21 @@ class FakeDocumentIndexService:
 
     def __init__(self) -> None:
         self.indexed_documents = []
+        self.index_calls: list[list[DocumentPayload]] = []
+        self.replaced_document_ids: list[list[str]] = []
         self.search_calls: list[tuple[str, int]] = []
         self.results: list[SearchResult] = []
         self.raise_not_ready = False
 
-    def index_documents(self, documents: Iterable[DocumentPayload]) -> int:
+    def index_documents(
+        self,
+        documents: Iterable[DocumentPayload],
+        *,
+        replace_document_ids: Iterable[str] = (),
+    ) -> int:
         self.indexed_documents = list(documents)
+        self.index_calls.append(self.indexed_documents)
+        self.replaced_document_ids.append(list(replace_document_ids))
         return len(self.indexed_documents)
 
     def search(self, query: str, *, limit: int) -> list[SearchResult]:
@@ -0,0 +1,190 @@
+"""Tests for PDF extraction batching and the upload indexing queue."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pymupdf
+import pytest
+from llama_index.core.embeddings import MockEmbedding
+
+from documents.schemas import DocumentPayload
+from documents.services import indexing_service, pdf_ingestion
+from documents.services.pdf_ingestion import (
+    PdfContent,
+    PdfIndexingQueue,
+    PdfIndexJob,
+    extract_pdf_content,
+)
+from documents.services.settings import DocumentSettings, PdfExtractionSettings
+
+if TYPE_CHECKING:
+    from .conftest import FakeDocumentIndexService
+
+
+def _fake_extract(path: Path, **_: object) -> PdfContent:
+    return PdfContent(text=f"text of {path.name}", page_count=1)
+
+
+def _jobs(tmp_path: Path, count: int) -> list[PdfIndexJob]:
+    return [
+        PdfIndexJob(file_path=tmp_path / f"doc-{idx}.pdf", document_id=f"doc-{idx}")
+        for idx in range(count)
+    ]
+
+
+def test_process_pdfs_for_indexing_flushes_in_batches(
+    fake_service: FakeDocumentIndexService, monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(pdf_ingestion, "extract_pdf_content", _fake_extract)
+
+    indexed_count = asyncio.run(
+        pdf_ingestion.process_pdfs_for_indexing(
+            _jobs(tmp_path, 3),
+            service=fake_service,
+            document_settings=DocumentSettings(index_batch_size=2),
+        )
+    )
+
+    assert indexed_count == 3
+    assert [[doc.document_id for doc in call] for call in fake_service.index_calls] == [
+        ["doc-0:0", "doc-1:0"],
+        ["doc-2:0"],
+    ]
+    assert fake_service.index_calls[0][0].content == "text of doc-0.pdf"
+
+
+def test_pdf_indexing_queue_coalesces_uploads(
+    fake_service: FakeDocumentIndexService, monkeypatch, tmp_path
+) -> None:
+    monkeypatch.setattr(pdf_ingestion, "extract_pdf_content", _fake_extract)
+
+    async def scenario() -> None:
+        queue = PdfIndexingQueue(document_settings=DocumentSettings(index_batch_window_ms=50))
+        queue.start()
+        for job in _jobs(tmp_path, 3):
+            queue.submit(job, fake_service)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert [[doc.document_id for doc in call] for call in fake_service.index_calls] == [
+        ["doc-0:0", "doc-1:0", "doc-2:0"],
+    ]
+
+
+def test_split_text_prefers_paragraph_boundaries_and_overlaps() -> None:
+    paragraphs = [f"Paragraph {idx} " + "word " * 30 for idx in range(4)]
+    text = "\n\n".join(paragraphs)
+
+    chunks = pdf_ingestion._split_text(text, max_chars=400, overlap=200)
+
+    assert all(len(chunk) <= 400 for chunk in chunks)
+    assert chunks[0].startswith("Paragraph 0")
+    assert chunks[1].startswith("Paragraph 1")
+    assert "Paragraph 3" in chunks[-1]
+
+
+def test_split_text_hard_splits_unbroken_text() -> None:
+    chunks = pdf_ingestion._split_text("x" * 250, max_chars=100, overlap=0)
+
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+
+def test_extract_pdf_content_reads_text_and_page_count(tmp_path) -> None:
+    path = tmp_path / "two-pages.pdf"
+    with pymupdf.open() as document:
+        for text in ("first page", "second page"):
+            document.new_page().insert_text((72, 72), text)
+        document.save(path)
+
+    content = extract_pdf_content(path)
+
+    assert content.page_count == 2
+    assert content.text.split() == ["first", "page", "second", "page"]
+
+
+def test_extract_pdf_content_keeps_long_blocks_on_dense_pages(tmp_path) -> None:
+    path = tmp_path / "figure.pdf"
+    with pymupdf.open() as document:
+        page = document.new_page()
+        page.insert_text((72, 72), "Fig. 1")
+        page.insert_text((72, 300), "Caption describing the measured results")
+        document.save(path)
+
+    content = extract_pdf_content(path, settings=PdfExtractionSettings(dense_stream_bytes=1))
+
+    assert content.text == "Caption describing the measured results"
+
+
+def test_extract_pdf_content_shares_one_page_pool_across_pdfs(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "four-pages.pdf"
+    with pymupdf.open() as document:
+        for number in range(4):
+            document.new_page().insert_text((72, 72), f"page {number}")
+        document.save(path)
+    monkeypatch.setattr(pdf_ingestion.os, "cpu_count", lambda: 2)
+    settings = PdfExtractionSettings(workers=2, min_pages_per_worker=1)
+    pdf_ingestion.start_page_pool(settings)
+    pool = pdf_ingestion._PAGE_POOL["pool"]
+    try:
+        pdf_ingestion.start_page_pool(settings)
+        first = extract_pdf_content(path, settings=settings)
+        second = extract_pdf_content(path, settings=settings)
+        assert pdf_ingestion._PAGE_POOL["pool"] is pool
+    finally:
+        pdf_ingestion.shutdown_page_pool()
+
+    assert first == second
+    assert first.text.split() == ["page", "0", "page", "1", "page", "2", "page", "3"]
+    assert pdf_ingestion._PAGE_POOL["pool"] is None
+    assert extract_pdf_content(path, settings=settings) == first
+
+
+def test_ingest_workers_extract_pages_serially(monkeypatch) -> None:
+    settings = PdfExtractionSettings(workers=4, min_pages_per_worker=1)
+    monkeypatch.setattr(pdf_ingestion.os, "cpu_count", lambda: 4)
+    monkeypatch.setitem(pdf_ingestion._PAGE_POOL, "pool", object())
+    assert pdf_ingestion._extraction_workers(settings, 40) == 4
+    assert pdf_ingestion._extraction_workers(settings, 2) == 2
+
+    pdf_ingestion.init_ingest_worker()
+
+    assert pdf_ingestion._extraction_workers(settings, 40) == 1
+
+
+def test_reindexing_a_document_drops_its_stale_chunks(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(
+        indexing_service, "HuggingFaceEmbedding", lambda model_name: MockEmbedding(embed_dim=8)
+    )
+    service = indexing_service.DocumentIndexService(DocumentSettings())
+    service.index_documents([DocumentPayload(document_id="other:0", content="kept")])
+    settings = DocumentSettings(chunk_max_chars=10, chunk_overlap_chars=0)
+    job = PdfIndexJob(file_path=tmp_path / "doc.pdf", document_id="doc")
+
+    def index(text: str) -> None:
+        monkeypatch.setattr(
+            pdf_ingestion,
+            "extract_pdf_content",
+            lambda path, **_: PdfContent(text=text, page_count=1),
+        )
+        asyncio.run(
+            pdf_ingestion.process_pdfs_for_indexing(
+                [job], service=service, document_settings=settings
+            )
+        )
+
+    index("first one\n\nsecond one\n\nthird one")
+    assert len([key for key in service._documents if key.startswith("doc:")]) > 1
+
+    index("only one")
+    assert sorted(service._documents) == ["doc:0", "other:0"]
+    assert service._documents["doc:0"].content == "only one"
+
+
+def test_extraction_settings_reject_unknown_backends() -> None:
+    assert PdfExtractionSettings(backend="pypdf").backend == "pypdf"
+    with pytest.raises(ValueError, match="backend"):
+        PdfExtractionSettings(backend="pypfd")  # type: ignore[arg-type]
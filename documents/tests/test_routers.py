@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 
 from documents.schemas import SearchResult
 from documents.services import pdf_ingestion
+from documents.services.pdf_ingestion import PdfContent
 
 if TYPE_CHECKING:
     from .conftest import FakeDocumentIndexService
@@ -90,11 +91,11 @@ def test_index_pdf_upload_schedules_background_task(
     extracted_text = "Parsed PDF content"
     captured_path: dict[str, Path] = {}
 
-    def fake_extract(path: Path) -> str:
+    def fake_extract(path: Path, **_: object) -> PdfContent:
         captured_path["path"] = path
-        return extracted_text
+        return PdfContent(text=extracted_text, page_count=3)
 
-    monkeypatch.setattr(pdf_ingestion, "extract_text_from_pdf", fake_extract)
+    monkeypatch.setattr(pdf_ingestion, "extract_pdf_content", fake_extract)
 
     response = client.post(
         "/documents/index/pdf",
@@ -111,9 +112,44 @@ def test_index_pdf_upload_schedules_background_task(
         "file_path": str(stored_path),
         "status": "accepted",
     }
-    assert stored_path.exists()
+    assert stored_path.read_bytes() == b"%PDF-1.4\n..."
     assert captured_path["path"] == stored_path
 
-    assert fake_service.indexed_documents[0].document_id == "doc-upload"
+    assert fake_service.indexed_documents[0].document_id == "doc-upload:0"
     assert fake_service.indexed_documents[0].content == extracted_text
     assert fake_service.indexed_documents[0].metadata["source_path"] == str(stored_path)
+    assert fake_service.indexed_documents[0].metadata["chunk_index"] == 0
+    assert fake_service.indexed_documents[0].metadata["page_count"] == 3
+
+
+def test_index_pdf_upload_persists_spooled_file(client: TestClient, monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("DOCUMENTS_UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(
+        pdf_ingestion, "extract_pdf_content", lambda path, **_: PdfContent(text="", page_count=0)
+    )
+
+    # Larger than Starlette's in-memory spool limit, so the upload arrives as a file on disk.
+    content = b"%PDF-1.4\n" + bytes(range(256)) * 8192
+
+    response = client.post(
+        "/documents/index/pdf",
+        data={"document_id": "doc-large"},
+        files={"file": ("large.pdf", content, "application/pdf")},
+    )
+
+    assert response.status_code == 202
+    assert Path(response.json()["file_path"]).read_bytes() == content
+
+
+def test_index_pdf_upload_rejects_empty_file(
+    client: TestClient, fake_service: FakeDocumentIndexService
+) -> None:
+    response = client.post(
+        "/documents/index/pdf",
+        data={"document_id": "doc-empty"},
+        files={"file": ("empty.pdf", b"", "application/pdf")},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Uploaded PDF is empty."}
+    assert fake_service.indexed_documents == []
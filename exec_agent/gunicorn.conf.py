@@ -0,0 +1,17 @@
+"""Gunicorn settings for running the exec_agent service with one worker per core.
+
+Usage, from the ``exec_agent`` directory::
+
+    APP_CONFIG=src/exec_agent/configs/local.yaml gunicorn
+
+``WEB_CONCURRENCY`` overrides the worker count and ``BIND`` the listen address.
+"""
+
+import multiprocessing
+import os
+
+wsgi_app = "exec_agent.app:application()"
+worker_class = "uvicorn_worker.UvicornWorker"
+# Requests mostly wait on the model API, so oversubscribe the cores.
+workers = int(os.environ.get("WEB_CONCURRENCY", 2 * multiprocessing.cpu_count() + 1))
+bind = os.environ.get("BIND", "0.0.0.0:9000")
@@ -0,0 +1,122 @@
+"""Response cache for repeated and paraphrased agent queries."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+import structlog
+
+LOGGER = structlog.get_logger(__name__)
+
+Embedder = Callable[[str], Awaitable[Sequence[float]]]
+
+
+@dataclass(slots=True)
+class SemanticCache:
+    """Cache final answers by exact input and, optionally, by embedding similarity.
+
+    Exact repeats are served from an LRU dict. When ``embed`` is set, a miss embeds the input and
+    compares it against a fixed-size ring of recent query embeddings with a single matrix-vector
+    product; a cosine similarity of at least ``similarity_threshold`` returns that answer. Entries
+    expire after ``ttl_seconds`` as measured by ``clock`` and only successful, non-empty answers
+    are stored.
+    """
+
+    max_entries: int = 1024
+    ttl_seconds: float = 300.0
+    similarity_threshold: float = 0.92
+    embed: Embedder | None = None
+    clock: Callable[[], float] = time.monotonic
+    _exact: OrderedDict[str, tuple[float, str]] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _vectors: np.ndarray | None = field(default=None, init=False, repr=False)
+    _answers: list[tuple[float, str] | None] = field(default_factory=list, init=False, repr=False)
+    _next_slot: int = field(default=0, init=False, repr=False)
+
+    async def get_or_compute(self, query: str, compute: Callable[[], Awaitable[str]]) -> str:
+        """Return a cached answer for ``query`` or compute, store and return a fresh one."""
+
+        now = self.clock()
+        cached = self._get_exact(query, now)
+        if cached is not None:
+            return cached
+
+        embedding = None
+        if self.embed is not None:
+            try:
+                embedding = _normalize(await self.embed(query))
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.warning("cache.embed_failed", error=str(exc))
+            if embedding is not None:
+                similar = self._get_similar(embedding, now)
+                if similar is not None:
+                    # Keep the original timestamp so paraphrases cannot extend an answer's TTL.
+                    stored_at, answer = similar
+                    self._put_exact(query, answer, stored_at)
+                    return answer
+
+        answer = await compute()
+        if answer:
+            now = self.clock()
+            self._put_exact(query, answer, now)
+            if embedding is not None:
+                self._put_similar(embedding, answer, now)
+        return answer
+
+    def _get_exact(self, query: str, now: float) -> str | None:
+        entry = self._exact.get(query)
+        if entry is None:
+            return None
+        stored_at, answer = entry
+        if now - stored_at > self.ttl_seconds:
+            del self._exact[query]
+            return None
+        self._exact.move_to_end(query)
+        return answer
+
+    def _put_exact(self, query: str, answer: str, stored_at: float) -> None:
+        self._exact[query] = (stored_at, answer)
+        self._exact.move_to_end(query)
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+    def _get_similar(self, embedding: np.ndarray, now: float) -> tuple[float, str] | None:
+        if self._vectors is None or not self._answers:
+            return None
+        filled = len(self._answers)
+        similarities = self._vectors[:filled] @ embedding
+        best = int(np.argmax(similarities))
+        entry = self._answers[best]
+        if entry is None or similarities[best] < self.similarity_threshold:
+            return None
+        if now - entry[0] > self.ttl_seconds:
+            self._answers[best] = None
+            self._vectors[best] = 0.0
+            return None
+        return entry
+
+    def _put_similar(self, embedding: np.ndarray, answer: str, now: float) -> None:
+        if self._vectors is None or self._vectors.shape[1] != embedding.shape[0]:
+            self._vectors = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+            self._answers = []
+            self._next_slot = 0
+        slot = self._next_slot
+        self._vectors[slot] = embedding
+        if slot < len(self._answers):
+            self._answers[slot] = (now, answer)
+        else:
+            self._answers.append((now, answer))
+        self._next_slot = (slot + 1) % self.max_entries
+
+
+def _normalize(values: Sequence[float]) -> np.ndarray | None:
+    vector = np.asarray(values, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if vector.ndim != 1 or norm == 0.0:
+        return None
+    return vector / norm
@@ -2,15 +2,37 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
-from typing import Any
-
+import asyncio
+import fnmatch
+import os
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+import httpx
+import litellm
+import orjson
 import structlog
 from litellm import acompletion, aresponses
-
-from exec_agent.agent.types import AgentResult, ChatMessage, ModelResponse, ToolCall
+from litellm.llms.custom_httpx.http_handler import (
+    AsyncHTTPHandler,
+    get_default_headers,
+    get_ssl_configuration,
+)
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from exec_agent.agent.types import (
+    AgentResult,
+    ChatMessage,
+    Conversation,
+    ModelResponse,
+    ToolCall,
+)
 from exec_agent.tools.base import ToolSpec
 from exec_agent.tools.executor import ToolExecutor
 from exec_agent.tools.policies import ToolAuthContext
@@ -18,6 +40,50 @@ from exec_agent.tools.registry import ToolRegistry
 
 LOGGER = structlog.get_logger(__name__)
 
+_RETRYABLE_ERRORS: Final = (
+    litellm.RateLimitError,
+    litellm.APIConnectionError,
+    litellm.InternalServerError,
+    litellm.ServiceUnavailableError,
+)
+
+# Exponential backoff from 0.25s, capped at 4s, with jitter so retries don't synchronize.
+_RETRY_WAIT: Final = wait_exponential_jitter(multiplier=0.25, max=4)
+
+_RESPONSES_API: Final = "responses"
+_CHAT_API: Final = "chat"
+
+# Models whose Responses API support is known up front. Anything else is probed once: the
+# first call goes through ``aresponses`` and an empty result pins the model to chat.
+_RESPONSES_MODEL_PATTERNS: Final = (
+    "gpt-4o*",
+    "gpt-4.1*",
+    "gpt-5*",
+    "o1*",
+    "o3*",
+    "o4*",
+    "openai/*",
+    "azure/*",
+)
+_CHAT_MODEL_PATTERNS: Final = (
+    "anthropic/*",
+    "claude-*",
+    "gemini/*",
+    "vertex_ai/*",
+    "bedrock/*",
+    "ollama/*",
+    "ollama_chat/*",
+    "groq/*",
+    "mistral/*",
+    "deepseek/*",
+)
+
+_MESSAGE_TYPES: Final = frozenset({"message", "output_message"})
+_TEXT_CHUNK_TYPES: Final = frozenset({"output_text", "text"})
+
+# Per-process cache of the API chosen for each model, shared by all clients.
+_API_BY_MODEL: dict[str, str] = {}
+
 
 def _get_attr(obj: Any, name: str, default: Any = None) -> Any:
     if isinstance(obj, dict):
@@ -25,22 +91,35 @@ def _get_attr(obj: Any, name: str, default: Any = None) -> Any:
     return getattr(obj, name, default)
 
 
-def _parse_tool_calls(tool_calls: Iterable[Any]) -> list[ToolCall]:
+def _accessor(values: Sequence[Any]) -> Callable[[Any, str, Any], Any]:
+    """Pick dict or attribute access once for a homogeneous list of response items.
+
+    LiteLLM returns either plain dicts or model objects for a whole response, so the inner
+    loops can use the chosen accessor directly instead of type-checking every read.
+    """
+
+    if values and isinstance(values[0], dict):
+        return dict.get
+    return getattr
+
+
+def _parse_tool_calls(tool_calls: Sequence[Any]) -> list[ToolCall]:
+    get = _accessor(tool_calls)
     parsed: list[ToolCall] = []
     for idx, raw_call in enumerate(tool_calls):
-        call_id = _get_attr(raw_call, "call_id", None) or _get_attr(raw_call, "id", f"call_{idx}")
-        function = _get_attr(raw_call, "function", None)
+        call_id = get(raw_call, "call_id", None) or get(raw_call, "id", f"call_{idx}")
+        function = get(raw_call, "function", None)
         if function is None:
-            name = _get_attr(raw_call, "name", "")
-            arguments = _get_attr(raw_call, "arguments", "")
+            name = get(raw_call, "name", "")
+            arguments = get(raw_call, "arguments", "")
         else:
             name = _get_attr(function, "name", "")
             arguments = _get_attr(function, "arguments", "")
         arguments_raw = arguments if isinstance(arguments, str) else None
         if isinstance(arguments, str):
             try:
-                arguments_obj = json.loads(arguments)
-            except json.JSONDecodeError:
+                arguments_obj = orjson.loads(arguments)
+            except orjson.JSONDecodeError:
                 arguments_obj = {}
         elif isinstance(arguments, dict):
             arguments_obj = arguments
@@ -62,31 +141,38 @@ def _extract_response_payload(response: Any) -> tuple[str, list[ToolCall]]:
     text_parts: list[str] = []
     tool_calls: list[ToolCall] = []
 
+    get = _accessor(output)
     for item in output:
-        item_type = _get_attr(item, "type", "")
-        if item_type in {"message", "output_message"}:
-            content = _get_attr(item, "content", []) or []
+        item_type = get(item, "type", "")
+        if item_type in _MESSAGE_TYPES:
+            content = get(item, "content", []) or []
+            get_chunk = _accessor(content)
             for chunk in content:
-                chunk_type = _get_attr(chunk, "type", "")
-                if chunk_type in {"output_text", "text"}:
-                    text_parts.extend(_coerce_text_chunks(_get_attr(chunk, "text", None) or chunk))
+                chunk_type = get_chunk(chunk, "type", "")
+                if chunk_type in _TEXT_CHUNK_TYPES:
+                    text = get_chunk(chunk, "text", None)
+                    # Common Responses API shape: plain string text, no coercion needed.
+                    if text and isinstance(text, str):
+                        text_parts.append(text)
+                    else:
+                        text_parts.extend(_coerce_text_chunks(text or chunk))
                 else:
                     text_parts.extend(_coerce_text_chunks(chunk))
-            raw_tool_calls = _get_attr(item, "tool_calls", None)
+            raw_tool_calls = get(item, "tool_calls", None)
             if raw_tool_calls:
                 tool_calls.extend(_parse_tool_calls(raw_tool_calls))
         elif item_type == "tool_call":
             tool_calls.extend(_parse_tool_calls([item]))
-        elif item_type in {"output_text", "text"}:
-            text = _get_attr(item, "text", "")
+        elif item_type in _TEXT_CHUNK_TYPES:
+            text = get(item, "text", "")
             if text:
                 text_parts.append(str(text))
         else:
-            if _looks_like_tool_call(item):
+            if get(item, "name", None) or get(item, "arguments", None) is not None:
                 tool_calls.extend(_parse_tool_calls([item]))
                 continue
-            text_parts.extend(_coerce_text_chunks(_get_attr(item, "text", None)))
-            content = _get_attr(item, "content", None)
+            text_parts.extend(_coerce_text_chunks(get(item, "text", None)))
+            content = get(item, "content", None)
             if content:
                 text_parts.extend(_coerce_text_chunks(content))
 
@@ -111,37 +197,39 @@ def _extract_response_payload(response: Any) -> tuple[str, list[ToolCall]]:
     return "".join(text_parts).strip(), tool_calls
 
 
-def _coerce_text_chunks(value: Any) -> list[str]:
-    if isinstance(value, str):
-        return [value] if value else []
-    if isinstance(value, dict):
-        text = value.get("text")
-        if isinstance(text, dict):
-            text = text.get("value") or text.get("text")
-        if text:
-            return [str(text)]
-        direct = value.get("value")
-        if direct:
-            return [str(direct)]
-        content = value.get("content")
-        if content:
-            return _coerce_text_chunks(content)
-        return []
-    if hasattr(value, "text"):
-        text = value.text
-        if isinstance(text, dict):
-            text = text.get("value") or text.get("text")
-        return [str(text)] if text else []
-    if isinstance(value, list):
-        chunks: list[str] = []
-        for item in value:
-            chunks.extend(_coerce_text_chunks(item))
-        return chunks
-    return []
-
-
-def _looks_like_tool_call(value: Any) -> bool:
-    return bool(_get_attr(value, "name", None)) or _get_attr(value, "arguments", None) is not None
+def _coerce_text_chunks(root: Any) -> list[str]:
+    # Iterative walk: nested content arrays are common and recursion costs a call per level.
+    chunks: list[str] = []
+    stack = [root]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if value:
+                chunks.append(value)
+        elif isinstance(value, dict):
+            text = value.get("text")
+            if isinstance(text, dict):
+                text = text.get("value") or text.get("text")
+            if text:
+                chunks.append(str(text))
+                continue
+            direct = value.get("value")
+            if direct:
+                chunks.append(str(direct))
+                continue
+            content = value.get("content")
+            if content:
+                stack.append(content)
+        elif isinstance(value, list):
+            # Reversed so items pop off the stack in their original order.
+            stack.extend(reversed(value))
+        elif hasattr(value, "text"):
+            text = value.text
+            if isinstance(text, dict):
+                text = text.get("value") or text.get("text")
+            if text:
+                chunks.append(str(text))
+    return chunks
 
 
 def _summarize_response(response: Any) -> dict[str, Any]:
@@ -185,7 +273,7 @@ def _preview_value(value: Any, limit: int = 800) -> str:
         data = value.__dict__
 
     try:
-        text = json.dumps(data, ensure_ascii=True, default=str)
+        text = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
     except TypeError:
         text = repr(data)
     if len(text) > limit:
@@ -193,15 +281,42 @@ def _preview_value(value: Any, limit: int = 800) -> str:
     return text
 
 
-def _to_chat_tool_spec(tool: ToolSpec) -> dict[str, Any]:
-    return {
-        "type": "function",
-        "function": {
-            "name": tool.name,
-            "description": tool.description,
-            "parameters": tool.input_schema,
-        },
-    }
+def _known_api(model: str) -> str | None:
+    if model in _API_BY_MODEL:
+        return _API_BY_MODEL[model]
+    name = model.lower()
+    if any(fnmatch.fnmatchcase(name, pattern) for pattern in _CHAT_MODEL_PATTERNS):
+        return _CHAT_API
+    if any(fnmatch.fnmatchcase(name, pattern) for pattern in _RESPONSES_MODEL_PATTERNS):
+        return _RESPONSES_API
+    return None
+
+
+def create_http_client(
+    *,
+    timeout_seconds: float,
+    http2: bool = True,
+    max_connections: int = 128,
+    max_keepalive_connections: int = 64,
+) -> httpx.AsyncClient:
+    """Create a pooled ``httpx`` client configured like LiteLLM's own.
+
+    It carries LiteLLM's default headers, SSL context and client certificate; proxies come
+    from the environment as usual for ``httpx``.
+    """
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+        timeout=timeout_seconds,
+        verify=get_ssl_configuration(None),
+        cert=os.getenv("SSL_CERTIFICATE", litellm.ssl_certificate),
+        headers=get_default_headers(),
+        follow_redirects=True,
+    )
 
 
 @dataclass(slots=True)
@@ -209,83 +324,135 @@ class LiteLLMChatClient:
     model: str
     temperature: float
     timeout_seconds: int
+    max_concurrency: int = 16
+    max_attempts: int = 3
+    _http_handler: AsyncHTTPHandler | None = field(default=None, init=False, repr=False)
+    _semaphore: asyncio.Semaphore = field(init=False, repr=False)
+    _api: str | None = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+        self._api = _known_api(self.model)
+        if self._api is not None:
+            _API_BY_MODEL[self.model] = self._api
+
+    async def use_http_client(self, http_client: httpx.AsyncClient | None) -> None:
+        """Send Responses API calls through a shared, pooled ``httpx`` client.
+
+        Build the client with :func:`create_http_client` so it keeps LiteLLM's headers and TLS
+        settings. Passing ``None`` reverts to LiteLLM's own client management.
+        """
+
+        if http_client is None:
+            self._http_handler = None
+            return
+        handler = AsyncHTTPHandler(timeout=self.timeout_seconds)
+        # The handler always creates a client of its own; close it before swapping in the
+        # shared one, which the handler then does not own or close.
+        await handler.close()
+        handler.client = http_client
+        self._http_handler = handler
 
     async def complete(
         self,
-        messages: Sequence[ChatMessage],
+        messages: Conversation | Sequence[ChatMessage],
+        tools: Sequence[ToolSpec],
+    ) -> ModelResponse:
+        if not isinstance(messages, Conversation):
+            messages = Conversation(list(messages))
+        if self._api is None:
+            self._api = _API_BY_MODEL.get(self.model)
+        if self._api == _CHAT_API:
+            return await self._complete_chat(messages, tools)
+
+        response = await self._complete_responses(messages, tools)
+        if self._api == _RESPONSES_API:
+            return response
+        if response.text or response.tool_calls:
+            self._pin_api(_RESPONSES_API)
+            return response
+
+        # Undecided model and the Responses API came back empty: switch to chat for good.
+        LOGGER.debug(
+            "llm.empty_response",
+            summary=_summarize_response(response.raw),
+            model=self.model,
+            fallback="acompletion",
+        )
+        self._pin_api(_CHAT_API)
+        return await self._complete_chat(messages, tools)
+
+    async def _complete_responses(
+        self,
+        messages: Conversation,
         tools: Sequence[ToolSpec],
     ) -> ModelResponse:
         payload = {
             "model": self.model,
             "temperature": self.temperature,
             "timeout": self.timeout_seconds,
-            "input": [item for message in messages for item in _to_responses_inputs(message)],
+            "input": messages.responses_inputs(),
         }
         if tools:
             payload["tools"] = [tool.to_openai() for tool in tools]
             payload["tool_choice"] = "auto"
+        if self._http_handler is not None:
+            payload["client"] = self._http_handler
 
-        response = await aresponses(**payload)
+        response = await self._call(aresponses, payload)
+        text, tool_calls = _extract_response_payload(response)
+        return ModelResponse(text=text, tool_calls=tool_calls, raw=response)
+
+    async def _complete_chat(
+        self,
+        messages: Conversation,
+        tools: Sequence[ToolSpec],
+    ) -> ModelResponse:
+        payload = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "timeout": self.timeout_seconds,
+            "messages": messages.chat_messages(),
+        }
+        if tools:
+            payload["tools"] = [tool.to_chat() for tool in tools]
+            payload["tool_choice"] = "auto"
+
+        response = await self._call(acompletion, payload)
         text, tool_calls = _extract_response_payload(response)
         if not text and not tool_calls:
             LOGGER.debug(
                 "llm.empty_response",
                 summary=_summarize_response(response),
                 model=self.model,
-                fallback="acompletion",
+                fallback="none",
             )
-            completion_payload = {
-                "model": self.model,
-                "temperature": self.temperature,
-                "timeout": self.timeout_seconds,
-                "messages": [message.to_openai() for message in messages],
-            }
-            if tools:
-                completion_payload["tools"] = [_to_chat_tool_spec(tool) for tool in tools]
-                completion_payload["tool_choice"] = "auto"
-            response = await acompletion(**completion_payload)
-            text, tool_calls = _extract_response_payload(response)
-            if not text and not tool_calls:
-                LOGGER.debug(
-                    "llm.empty_response",
-                    summary=_summarize_response(response),
-                    model=self.model,
-                    fallback="none",
-                )
         return ModelResponse(text=text, tool_calls=tool_calls, raw=response)
 
+    def _pin_api(self, api: str) -> None:
+        self._api = api
+        _API_BY_MODEL[self.model] = api
+        LOGGER.info("llm.api_selected", model=self.model, api=api)
+
+    async def _call(self, api: Callable[..., Awaitable[Any]], payload: dict[str, Any]) -> Any:
+        """Call ``api`` under the concurrency limit, retrying transient provider errors.
 
-def _to_responses_inputs(message: ChatMessage) -> list[dict[str, Any]]:
-    items: list[dict[str, Any]] = []
-    if message.role == "tool":
-        items.append(
-            {
-                "type": "function_call_output",
-                "call_id": message.tool_call_id or "",
-                "output": message.content or "",
-            }
+        The semaphore is only held while a request is in flight, not during backoff.
+        """
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(max(1, self.max_attempts)),
+            wait=_RETRY_WAIT,
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+            reraise=True,
         )
-        return items
-
-    if message.content:
-        payload: dict[str, Any] = {"role": message.role, "content": message.content}
-        if message.name:
-            payload["name"] = message.name
-        items.append(payload)
-
-    if message.tool_calls:
-        for call in message.tool_calls:
-            arguments = call.arguments_raw or json.dumps(call.arguments, ensure_ascii=True)
-            items.append(
-                {
-                    "type": "function_call",
-                    "call_id": call.id,
-                    "name": call.name,
-                    "arguments": arguments,
-                }
-            )
+        return await retrying(self._call_limited, api, payload)
 
-    return items
+    async def _call_limited(
+        self, api: Callable[..., Awaitable[Any]], payload: dict[str, Any]
+    ) -> Any:
+        async with self._semaphore:
+            return await api(**payload)
 
 
 @dataclass(slots=True)
@@ -304,14 +471,15 @@ class AgentRunner:
         auth: ToolAuthContext | None = None,
         system_prompt: str | None = None,
     ) -> AgentResult:
-        messages: list[ChatMessage] = []
+        messages = Conversation()
         if system_prompt:
             messages.append(ChatMessage(role="system", content=system_prompt))
         messages.append(ChatMessage(role="user", content=user_input))
 
+        tool_specs = self.registry.list_specs(auth)
         call_count = 0
         for step in range(self.max_steps):
-            response = await self.client.complete(messages, self.registry.list_specs(auth))
+            response = await self.client.complete(messages, tool_specs)
             if response.tool_calls:
                 assistant_text = response.text.strip()
                 messages.append(
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
+
 JsonValue = Any
 
 
@@ -20,7 +21,7 @@ class ToolCall:
     arguments_raw: str | None = None
 
     def to_openai(self) -> dict[str, Any]:
-        arguments = self.arguments_raw or json.dumps(self.arguments, ensure_ascii=True)
+        arguments = self.arguments_raw or orjson.dumps(self.arguments).decode()
         return {
             "id": self.id,
             "type": "function",
@@ -37,16 +38,100 @@ class ChatMessage:
     name: str | None = None
     tool_call_id: str | None = None
     tool_calls: list[ToolCall] = field(default_factory=list)
+    # Messages are not mutated once appended to a conversation, but the whole conversation
+    # is re-sent every turn, so the serialized forms are cached per message. Callers get
+    # shallow copies, so nothing they hand on to the client can alter the cache.
+    _openai: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+    _responses_inputs: list[dict[str, Any]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_openai(self) -> dict[str, Any]:
-        payload: dict[str, Any] = {"role": self.role, "content": self.content or ""}
-        if self.name:
-            payload["name"] = self.name
-        if self.tool_call_id:
-            payload["tool_call_id"] = self.tool_call_id
-        if self.tool_calls:
-            payload["tool_calls"] = [call.to_openai() for call in self.tool_calls]
-        return payload
+        """Return the Chat Completions message dict."""
+
+        if self._openai is None:
+            payload: dict[str, Any] = {"role": self.role, "content": self.content or ""}
+            if self.name:
+                payload["name"] = self.name
+            if self.tool_call_id:
+                payload["tool_call_id"] = self.tool_call_id
+            if self.tool_calls:
+                payload["tool_calls"] = [call.to_openai() for call in self.tool_calls]
+            self._openai = payload
+        return dict(self._openai)
+
+    def to_responses_inputs(self) -> list[dict[str, Any]]:
+        """Return the Responses API input items for this message."""
+
+        if self._responses_inputs is None:
+            self._responses_inputs = self._build_responses_inputs()
+        return list(self._responses_inputs)
+
+    def _build_responses_inputs(self) -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        if self.role == "tool":
+            items.append(
+                {
+                    "type": "function_call_output",
+                    "call_id": self.tool_call_id or "",
+                    "output": self.content or "",
+                }
+            )
+            return items
+
+        if self.content:
+            payload: dict[str, Any] = {"role": self.role, "content": self.content}
+            if self.name:
+                payload["name"] = self.name
+            items.append(payload)
+
+        for call in self.tool_calls:
+            arguments = call.arguments_raw or orjson.dumps(call.arguments).decode()
+            items.append(
+                {
+                    "type": "function_call",
+                    "call_id": call.id,
+                    "name": call.name,
+                    "arguments": arguments,
+                }
+            )
+
+        return items
+
+
+@dataclass(slots=True)
+class Conversation:
+    """Messages of one agent run plus their request payloads, extended as messages arrive.
+
+    Each turn re-sends the whole conversation; keeping the flattened payload lists here means a
+    turn only serializes the messages appended since the previous request. The lists keep
+    growing in place, so each call returns a shallow copy that later turns cannot change.
+    """
+
+    messages: list[ChatMessage] = field(default_factory=list)
+    _responses_inputs: list[dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _responses_synced: int = field(default=0, init=False, repr=False)
+    _chat_messages: list[dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _chat_synced: int = field(default=0, init=False, repr=False)
+
+    def append(self, message: ChatMessage) -> None:
+        self.messages.append(message)
+
+    def responses_inputs(self) -> list[dict[str, Any]]:
+        """Return the Responses API ``input`` items for every message so far."""
+
+        for message in self.messages[self._responses_synced :]:
+            self._responses_inputs.extend(message.to_responses_inputs())
+        self._responses_synced = len(self.messages)
+        return list(self._responses_inputs)
+
+    def chat_messages(self) -> list[dict[str, Any]]:
+        """Return the Chat Completions ``messages`` for every message so far."""
+
+        for message in self.messages[self._chat_synced :]:
+            self._chat_messages.append(message.to_openai())
+        self._chat_synced = len(self.messages)
+        return list(self._chat_messages)
 
 
 @dataclass(slots=True)
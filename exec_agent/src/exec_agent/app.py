@@ -5,27 +5,41 @@ from __future__ import annotations
 import asyncio
 import math
 import re
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Final
 
 import litellm
+import orjson
 import structlog
 import uvicorn
-from core.cmd_utils import load_app_settings
+from core.cmd_utils import (
+    export_app_settings_env,
+    load_app_settings,
+    load_app_settings_from_env,
+)
 from core.logging import configure_logging
 from fastapi import APIRouter, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
-from exec_agent.agent.runner import AgentRunner, LiteLLMChatClient
+from exec_agent.agent.cache import SemanticCache
+from exec_agent.agent.runner import AgentRunner, LiteLLMChatClient, create_http_client
 from exec_agent.infra.config import AppSettings
 from exec_agent.tools.executor import ToolExecutor
-from exec_agent.tools.impl.retrieve import RetrieveTool
+from exec_agent.tools.impl.retrieve import IndexedCorpus, RetrieveTool
 from exec_agent.tools.policies import ToolPolicy
 from exec_agent.tools.registry import ToolRegistry
 
 LOGGER: Final = structlog.get_logger(__name__)
 
+_RETRY_DELAY_RE: Final = re.compile(r'"retryDelay"\s*:\s*"([0-9.]+)s"')
+
+# uvloop is Unix-only.
+_EVENT_LOOP: Final = "asyncio" if sys.platform == "win32" else "uvloop"
+
 
 class QueryRequest(BaseModel):
     user_input: str = Field(..., min_length=1)
@@ -37,28 +51,83 @@ class QueryResponse(BaseModel):
 
 def build_agent_runner(settings: AppSettings) -> AgentRunner:
     registry = ToolRegistry()
-    enabled = set(settings.tools.enabled_tools)
+    enabled = frozenset(settings.tools.enabled_tools)
     if "retrieve" in enabled:
-        registry.register(RetrieveTool(settings.retrieval))
+        corpus = None
+        if settings.retrieval.index_corpus:
+            corpus = IndexedCorpus(settings.retrieval)
+            corpus.refresh()
+        registry.register(RetrieveTool(settings.retrieval, corpus=corpus))
 
     policy = ToolPolicy(allowed_tools=enabled, max_calls=settings.tools.max_calls)
-    executor = ToolExecutor(registry, policy)
+    executor = ToolExecutor(registry, policy, max_concurrency=settings.tools.max_concurrency)
     client = LiteLLMChatClient(
         model=settings.llm.model,
         temperature=settings.llm.temperature,
         timeout_seconds=settings.llm.timeout_seconds,
+        max_concurrency=settings.llm.max_concurrency,
+        max_attempts=settings.llm.max_attempts,
     )
     return AgentRunner(client=client, registry=registry, executor=executor)
 
 
+def build_response_cache(settings: AppSettings) -> SemanticCache | None:
+    cache_settings = settings.response_cache
+    if not cache_settings.enabled:
+        return None
+
+    embed = None
+    if cache_settings.embedding_model:
+
+        async def embed(text: str) -> list[float]:
+            response = await litellm.aembedding(
+                model=cache_settings.embedding_model,
+                input=[text],
+                timeout=settings.llm.timeout_seconds,
+            )
+            return response.data[0]["embedding"]
+
+    return SemanticCache(
+        max_entries=cache_settings.max_entries,
+        ttl_seconds=cache_settings.ttl_seconds,
+        similarity_threshold=cache_settings.similarity_threshold,
+        embed=embed,
+    )
+
+
 def create_app(settings: AppSettings) -> FastAPI:
     """Instantiate a FastAPI application configured with defaults."""
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Built here rather than in create_app so every server process gets its own runner
+        # and one pooled client, letting model calls reuse TCP/TLS connections.
+        app.state.agent_runner = build_agent_runner(settings)
+        app.state.response_cache = build_response_cache(settings)
+        app.state.query_semaphore = asyncio.Semaphore(settings.backend_concurrency)
+        async with create_http_client(
+            timeout_seconds=settings.llm.timeout_seconds,
+            http2=settings.llm.http2,
+            max_connections=settings.llm.max_connections,
+            max_keepalive_connections=settings.llm.max_keepalive_connections,
+        ) as http_client:
+            app.state.http_client = http_client
+            runner: AgentRunner = app.state.agent_runner
+            await runner.client.use_http_client(http_client)
+            litellm.aclient_session = http_client
+            try:
+                yield
+            finally:
+                litellm.aclient_session = None
+                await runner.client.use_http_client(None)
+                app.state.http_client = None
+
     app = FastAPI(
         title=settings.title or "App Template",
         description=settings.description,
         version=settings.version,
         default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     app.add_middleware(
@@ -69,7 +138,6 @@ def create_app(settings: AppSettings) -> FastAPI:
         allow_headers=["*"],
     )
 
-    app.state.agent_runner = build_agent_runner(settings)
     register_routes(app, settings)
     return app
 
@@ -77,78 +145,159 @@ def create_app(settings: AppSettings) -> FastAPI:
 def register_routes(app: FastAPI, settings: AppSettings) -> None:
     """Attach routes that demonstrate the service layout."""
 
+    # Probe responses never change, so serialize them once and skip validation per call.
+    health_body = orjson.dumps({"status": "ok"})
+    ping_body = orjson.dumps(
+        {
+            "message": "pong",
+            "service": settings.service_name or "exec_agent",
+        }
+    )
+
     @app.get("/", include_in_schema=False)
-    def healthcheck() -> dict[str, str]:
-        return {"status": "ok"}
+    async def healthcheck() -> Response:
+        return Response(content=health_body, media_type="application/json")
 
     router = APIRouter(prefix=settings.api_prefix, tags=["exec_agent"])
 
     @router.get("/ping")
-    def ping() -> dict[str, str]:
-        return {
-            "message": "pong",
-            "service": settings.service_name or "exec_agent",
-        }
+    async def ping() -> Response:
+        return Response(content=ping_body, media_type="application/json")
+
+    # The documented schema stays QueryResponse, but the body is serialized directly rather than
+    # validated through the model on every response.
+    @router.post("/query", response_class=ORJSONResponse, responses={200: {"model": QueryResponse}})
+    async def query(payload: QueryRequest) -> ORJSONResponse:
+        async def run_agent() -> str:
+            semaphore: asyncio.Semaphore = app.state.query_semaphore
+            try:
+                await asyncio.wait_for(
+                    semaphore.acquire(), settings.backend_acquire_timeout_seconds
+                )
+            except TimeoutError as exc:
+                LOGGER.warning("exec_agent.busy")
+                raise HTTPException(
+                    status_code=503,
+                    detail="Server busy. Please retry later.",
+                    headers={"Retry-After": "1"},
+                ) from exc
+            try:
+                runner: AgentRunner = app.state.agent_runner
+                result = await runner.run(payload.user_input)
+            finally:
+                semaphore.release()
+            return result.output
 
-    @router.post("/query", response_model=QueryResponse)
-    async def query(payload: QueryRequest) -> QueryResponse:
         try:
-            runner: AgentRunner = app.state.agent_runner
-            result = await runner.run(payload.user_input)
+            cache: SemanticCache | None = app.state.response_cache
+            if cache is None:
+                output = await run_agent()
+            else:
+                output = await cache.get_or_compute(payload.user_input, run_agent)
         except litellm.RateLimitError as exc:
             LOGGER.warning("exec_agent.rate_limited", error=str(exc))
             detail, headers = _rate_limit_response(exc)
             raise HTTPException(status_code=429, detail=detail, headers=headers) from exc
+        except HTTPException:
+            raise
         except Exception as exc:
             LOGGER.exception("exec_agent.query_failed", error=str(exc))
             raise HTTPException(status_code=502, detail="Model request failed") from exc
 
-        if not result.output:
+        if not output:
             raise HTTPException(status_code=502, detail="Model response empty")
 
-        return QueryResponse(response=result.output)
+        return ORJSONResponse({"response": output})
 
     app.include_router(router)
 
 
+def application() -> FastAPI:
+    """App factory for process managers, configured from ``APP_CONFIG``/``APP_ENV_FILE``.
+
+    See ``gunicorn.conf.py`` for running one worker per core.
+    """
+
+    settings: AppSettings = load_app_settings_from_env(AppSettings)
+    configure_logging(settings.logging)
+    return create_app(settings)
+
+
 def serve() -> None:
-    """Entrypoint that mirrors other subprojects."""
+    """Entrypoint that mirrors other subprojects.
+
+    With ``workers > 1`` uvicorn starts that many processes, each building its own app through
+    :func:`application`; otherwise (or with ``reload``) the app is served in-process.
+    """
 
     settings: AppSettings = load_app_settings(AppSettings, None)
 
     configure_logging(settings.logging)
-    application = create_app(settings)
 
     LOGGER.info(
         "exec_agent.startup",
         host=settings.host,
         port=settings.port,
+        workers=settings.workers,
         service_name=settings.service_name,
         metadata=settings.metadata,
     )
 
+    if settings.workers > 1 and not settings.reload:
+        export_app_settings_env(None)
+        uvicorn.run(
+            "exec_agent.app:application",
+            factory=True,
+            workers=settings.workers,
+            host=settings.host,
+            port=settings.port,
+            loop=_EVENT_LOOP,
+            http="httptools",
+            limit_concurrency=settings.max_concurrent_queries,
+            log_config=None,
+            access_log=False,
+        )
+        return
+
+    application = create_app(settings)
     config = uvicorn.Config(
         app=application,
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
+        loop=_EVENT_LOOP,
+        http="httptools",
+        limit_concurrency=settings.max_concurrent_queries,
+        # Logging is configured by configure_logging; skip uvicorn's dictConfig and the
+        # per-request access log line.
+        log_config=None,
+        access_log=False,
     )
     server = uvicorn.Server(config=config)
-    asyncio.run(server.serve())
+    # Server.run() builds the event loop from ``config.loop``; serve() would inherit asyncio's.
+    server.run()
 
 
 def _rate_limit_response(exc: Exception) -> tuple[str, dict[str, str]]:
     detail = "Model rate limit exceeded. Please retry later."
     headers: dict[str, str] = {}
-    retry_after = _extract_retry_after_seconds(str(exc))
+    retry_after = _retry_after_seconds(exc)
     if retry_after is not None:
         detail = f"{detail} Retry after {retry_after} seconds."
         headers["Retry-After"] = str(retry_after)
     return detail, headers
 
 
+def _retry_after_seconds(exc: Exception) -> int | None:
+    # Some providers surface the delay structurally; otherwise parse it from the error body.
+    retry_after = getattr(exc, "retry_after", None)
+    if isinstance(retry_after, int | float) and retry_after > 0:
+        return math.ceil(retry_after)
+    return _extract_retry_after_seconds(str(exc))
+
+
 def _extract_retry_after_seconds(message: str) -> int | None:
-    match = re.search(r'"retryDelay"\\s*:\\s*"([0-9.]+)s"', message)
+    match = _RETRY_DELAY_RE.search(message)
     if not match:
         return None
     try:
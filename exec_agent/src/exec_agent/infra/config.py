@@ -1,44 +1,73 @@
-"""Configuration helpers for the exec agent service."""
+"""Configuration helpers for the exec agent service.
+
+Settings are plain frozen, slotted dataclasses like ``CoreSettings``; values are converted and
+checked once by ``core.settings.load_dataclass_from_yaml`` when the YAML is loaded.
+"""
 
 from __future__ import annotations
 
 import dataclasses
+import os
 
-import pydantic.dataclasses as pydantic_dataclasses
 from core.settings import CoreSettings
 
 
-@pydantic_dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class LlmSettings:
     model: str = ""
     timeout_seconds: int = 30
     temperature: float = 0
+    max_concurrency: int = 16  # in-flight model calls per process
+    max_attempts: int = 3  # retries rate-limit, connection and 5xx errors
+    http2: bool = True
+    max_connections: int = 128
+    max_keepalive_connections: int = 64
 
 
-@pydantic_dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class RetrievalSettings:
     search_paths: list[str] = dataclasses.field(default_factory=lambda: ["documents", "README.md"])
     file_globs: list[str] = dataclasses.field(default_factory=lambda: ["**/*.md", "**/*.txt"])
     max_results: int = 5
     max_snippet_chars: int = 200
     max_file_size_kb: int = 256
+    index_corpus: bool = True  # answer multi-token queries from an inverted token index
 
 
-@pydantic_dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ToolSettings:
     enabled_tools: list[str] = dataclasses.field(default_factory=lambda: ["retrieve"])
     max_calls: int = 8
+    max_concurrency: int = 0  # tool calls from one model turn run at once; 0 means no limit
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ResponseCacheSettings:
+    enabled: bool = False  # answers may be up to ttl_seconds stale; opt in per deployment
+    max_entries: int = 1024
+    ttl_seconds: float = 300
+    embedding_model: str = ""  # empty disables near-duplicate matching; exact repeats only
+    similarity_threshold: float = 0.92  # cosine similarity for a near-duplicate hit
 
 
-@pydantic_dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class AppSettings(CoreSettings):
     api_prefix: str = "/v1"
     cors_origins: list[str] = dataclasses.field(default_factory=lambda: ["*"])
     host: str = "0.0.0.0"
     port: int = 8000
     reload: bool = False
+    # uvicorn worker processes; model calls are I/O-bound, so oversubscribe the cores
+    workers: int = 2 * (os.cpu_count() or 1) + 1
+    # Per worker: uvicorn answers 503 beyond max_concurrent_queries open connections, and at
+    # most backend_concurrency agent runs proceed at once; /query answers 503 if a slot does not
+    # free up within backend_acquire_timeout_seconds.
+    max_concurrent_queries: int = 32
+    backend_concurrency: int = 16
+    backend_acquire_timeout_seconds: float = 0.5
     service_name: str = "app-template"
     metadata: dict[str, str] = dataclasses.field(default_factory=dict)
     llm: LlmSettings = LlmSettings()
     tools: ToolSettings = ToolSettings()
     retrieval: RetrievalSettings = RetrievalSettings()
+    response_cache: ResponseCacheSettings = ResponseCacheSettings()
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, nullcontext
+from typing import Final
 
 from opentelemetry import trace
 
+# A proxy tracer: it starts delegating to the real provider once one is installed.
+_TRACER: Final = trace.get_tracer(__name__)
+_NO_SPAN: Final = nullcontext()
+_UNCONFIGURED_PROVIDERS: Final = (trace.ProxyTracerProvider, trace.NoOpTracerProvider)
 
-@contextmanager
-def tool_span(name: str, **attributes: object) -> Iterator[None]:
-    tracer = trace.get_tracer(__name__)
-    with tracer.start_as_current_span(name) as span:
-        for key, value in attributes.items():
-            span.set_attribute(key, value)
-        yield
+
+def tool_span(name: str, **attributes: object) -> AbstractContextManager[object]:
+    """Return a span context for one tool call, or a shared no-op when tracing is not set up."""
+
+    # Checked per call so a provider installed after import is still picked up.
+    if isinstance(trace.get_tracer_provider(), _UNCONFIGURED_PROVIDERS):
+        return _NO_SPAN
+    return _TRACER.start_as_current_span(name, attributes=attributes)
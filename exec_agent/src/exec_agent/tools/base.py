@@ -7,6 +7,8 @@ from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any, Protocol
 
+import orjson
+
 JsonValue = Any
 
 
@@ -17,15 +19,40 @@ class ToolSpec:
     name: str
     description: str
     input_schema: Mapping[str, JsonValue]
-    scopes: list[str] = field(default_factory=list)
-
-    def to_openai(self) -> dict[str, Any]:
-        return {
+    scopes: frozenset[str] = frozenset()
+    # Results are UTF-8 JSON by default; set for consumers that need \uXXXX-escaped ASCII.
+    ascii_only: bool = False
+    _openai: dict[str, Any] = field(init=False, repr=False, compare=False)
+    _chat: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Scopes are checked on every tool call; accept any iterable but keep a frozenset.
+        self.scopes = frozenset(self.scopes)
+        # Specs are sent with every model turn; build the payload once and share it.
+        self._openai = {
             "type": "function",
             "name": self.name,
             "description": self.description,
             "parameters": self.input_schema,
         }
+        self._chat = {
+            "type": "function",
+            "function": {
+                "name": self.name,
+                "description": self.description,
+                "parameters": self.input_schema,
+            },
+        }
+
+    def to_openai(self) -> dict[str, Any]:
+        """Return the Responses API tool payload."""
+
+        return self._openai
+
+    def to_chat(self) -> dict[str, Any]:
+        """Return the Chat Completions tool payload."""
+
+        return self._chat
 
 
 @dataclass(slots=True)
@@ -45,14 +72,22 @@ class ToolResult:
         data: JsonValue,
         *,
         content: str | None = None,
+        ascii_only: bool = False,
     ) -> ToolResult:
-        text = content or json.dumps(data, ensure_ascii=True)
+        text = content or _dumps(data, ascii_only=ascii_only)
         return cls(name=name, ok=True, content=text, data=data)
 
     @classmethod
     def failure(cls, name: str, error: str) -> ToolResult:
         payload = {"error": error}
-        return cls(name=name, ok=False, content=json.dumps(payload, ensure_ascii=True), error=error)
+        return cls(name=name, ok=False, content=orjson.dumps(payload).decode(), error=error)
+
+
+def _dumps(data: JsonValue, *, ascii_only: bool) -> str:
+    if ascii_only:
+        # orjson always emits UTF-8; the stdlib encoder escapes with the same compact layout.
+        return json.dumps(data, separators=(",", ":"))
+    return orjson.dumps(data).decode()
 
 
 class Tool(Protocol):
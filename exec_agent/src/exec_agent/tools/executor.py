@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from collections.abc import Iterable
+from contextlib import nullcontext
 from dataclasses import dataclass
 
 import structlog
 
 from exec_agent.agent.types import ToolCall
 from exec_agent.infra.tracing import tool_span
-from exec_agent.tools.base import ToolResult
+from exec_agent.tools.base import Tool, ToolResult
 from exec_agent.tools.policies import ToolAuthContext, ToolPolicy
 from exec_agent.tools.registry import ToolRegistry
 
@@ -25,9 +28,17 @@ class ToolExecutionSummary:
 class ToolExecutor:
     """Execute tool calls and normalize failures."""
 
-    def __init__(self, registry: ToolRegistry, policy: ToolPolicy) -> None:
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        policy: ToolPolicy,
+        *,
+        max_concurrency: int = 0,
+    ) -> None:
         self._registry = registry
         self._policy = policy
+        # Caps how many tool calls from one model turn run at once; 0 means no limit.
+        self._max_concurrency = max_concurrency
 
     async def execute(
         self,
@@ -36,7 +47,10 @@ class ToolExecutor:
         auth: ToolAuthContext | None,
         call_count: int = 0,
     ) -> ToolExecutionSummary:
-        results: list[ToolResult] = []
+        # Policy checks run in call order so call limits apply exactly as before; the allowed
+        # calls then run concurrently and their results are written back in call order.
+        results: list[ToolResult | None] = []
+        pending: list[tuple[int, ToolCall, Tool, int]] = []
         for call in calls:
             tool = self._registry.get(call.name)
             if tool is None:
@@ -51,25 +65,57 @@ class ToolExecutor:
                 continue
 
             call_count += 1
+            pending.append((len(results), call, tool, call_count))
+            results.append(None)
+
+        if pending:
+            semaphore = (
+                asyncio.Semaphore(self._max_concurrency) if self._max_concurrency > 0 else None
+            )
+            outcomes = await asyncio.gather(
+                *(
+                    self._run_one(call, tool, call_number, semaphore)
+                    for _, call, tool, call_number in pending
+                )
+            )
+            for (index, _, _, _), result in zip(pending, outcomes, strict=True):
+                results[index] = result
+
+        return ToolExecutionSummary(
+            results=[result for result in results if result is not None],
+            call_count=call_count,
+        )
+
+    async def _run_one(
+        self,
+        call: ToolCall,
+        tool: Tool,
+        call_number: int,
+        semaphore: asyncio.Semaphore | None,
+    ) -> ToolResult:
+        async with semaphore if semaphore is not None else nullcontext():
             with tool_span("tool.execute", tool_name=call.name):
                 try:
-                    LOGGER.debug(
-                        "tool.execute_start",
-                        tool=call.name,
-                        call_id=call.id,
-                        arguments=call.arguments,
-                        call_count=call_count,
-                    )
+                    # Checked per call (levels can change at runtime) so the event dicts are
+                    # only built when debug output is actually enabled.
+                    debug = LOGGER.is_enabled_for(logging.DEBUG)
+                    if debug:
+                        LOGGER.debug(
+                            "tool.execute_start",
+                            tool=call.name,
+                            call_id=call.id,
+                            arg_keys=list(call.arguments),
+                            call_count=call_number,
+                        )
                     result = await tool.run(call.arguments)
-                    LOGGER.debug(
-                        "tool.execute_end",
-                        tool=call.name,
-                        call_id=call.id,
-                        ok=result.ok,
-                    )
+                    if debug:
+                        LOGGER.debug(
+                            "tool.execute_end",
+                            tool=call.name,
+                            call_id=call.id,
+                            ok=result.ok,
+                        )
                 except Exception as exc:  # pragma: no cover - defensive logging
                     LOGGER.exception("tool.execute_failed", tool=call.name, error=str(exc))
                     result = ToolResult.failure(call.name, "tool_execution_failed")
-            results.append(result)
-
-        return ToolExecutionSummary(results=results, call_count=call_count)
+        return result
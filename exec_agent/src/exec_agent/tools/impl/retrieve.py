@@ -2,21 +2,481 @@
 
 from __future__ import annotations
 
-import json
-from collections.abc import Mapping
+import asyncio
+import fnmatch
+import mmap
+import os
+import re
+import stat
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import accumulate, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from exec_agent.infra.config import RetrievalSettings
 from exec_agent.tools.base import ToolResult, ToolSpec
 
+# Loaded files are cached up to this many bytes of file content per process.
+_FILE_CACHE_BYTES: Final = 32 * 1024 * 1024
+_TOKEN_RE: Final = re.compile(r"[a-z0-9]{2,}")
+
+# One pool per process for file scans, so the event loop never blocks on disk reads and calls
+# do not pay for thread start-up.
+_SCAN_WORKERS: Final = min(32, (os.cpu_count() or 1) * 4)
+_SCAN_EXECUTOR: Final = ThreadPoolExecutor(
+    max_workers=_SCAN_WORKERS, thread_name_prefix="retrieve-scan"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _LoadedFile:
+    """A decoded file's lines plus one casefolded buffer for C-level substring search."""
+
+    lines: tuple[str, ...]
+    folded: str
+    # Start offset of each line in ``folded``; casefolding can change a line's length, so
+    # offsets are taken from the folded lines rather than the originals.
+    line_starts: array[int]
+
+    def find_lines(self, query_folded: str, limit: int) -> list[tuple[int, str]]:
+        """Return ``(line number, line)`` for up to ``limit`` lines containing ``query_folded``."""
+
+        found: list[tuple[int, str]] = []
+        if not query_folded or "\n" in query_folded:
+            return found
+        position = self.folded.find(query_folded)
+        while position >= 0 and len(found) < limit:
+            index = bisect_right(self.line_starts, position) - 1
+            found.append((index + 1, self.lines[index]))
+            if index + 1 >= len(self.line_starts):
+                break
+            # Resume at the next line so a line with several hits is reported once.
+            position = self.folded.find(query_folded, self.line_starts[index + 1])
+        return found
+
+
+@dataclass(frozen=True, slots=True)
+class _AsciiFile:
+    """A lowered copy of an ASCII file whose only line breaks are ``\\n``.
+
+    For such files ``bytes.lower`` is exactly ``str.casefold`` and ``\\n`` splits lines exactly
+    like ``str.splitlines``, so searching needs no decode and no per-line strings: hits come
+    from ``bytes.find`` over the lowered buffer and line numbers from counting newlines between
+    hits. Only the lowered copy is cached; matched lines are read back from a mapping of the
+    file itself to keep their case.
+    """
+
+    path: str
+    folded: bytes
+
+    def find_lines(self, query_folded: str, limit: int) -> list[tuple[int, str]]:
+        """Return ``(line number, line)`` for up to ``limit`` lines containing ``query_folded``."""
+
+        spans: list[tuple[int, int, int]] = []
+        if not query_folded or "\n" in query_folded or not query_folded.isascii():
+            return []
+        needle = query_folded.encode("ascii")
+        folded = self.folded
+        line_no = 1
+        counted = 0
+        position = folded.find(needle)
+        while position >= 0 and len(spans) < limit:
+            line_no += folded.count(b"\n", counted, position)
+            start = folded.rfind(b"\n", 0, position) + 1
+            end = folded.find(b"\n", position)
+            if end < 0:
+                end = len(folded)
+            spans.append((line_no, start, end))
+            # Resume at the next line so a line with several hits is reported once.
+            counted = end
+            position = folded.find(needle, end + 1)
+        return self._read_lines(spans) if spans else []
+
+    def _read_lines(self, spans: list[tuple[int, int, int]]) -> list[tuple[int, str]]:
+        try:
+            with (
+                open(self.path, "rb") as handle,
+                mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                # A file rewritten since it was indexed falls back to the lowered lines.
+                if len(mapped) == len(self.folded):
+                    return [
+                        (no, mapped[start:end].decode("ascii", "replace"))
+                        for no, start, end in spans
+                    ]
+        except (OSError, ValueError):
+            pass
+        return [(no, self.folded[start:end].decode("ascii")) for no, start, end in spans]
+
+
+_EMPTY_FILE: Final = _AsciiFile(path="", folded=b"")
+
+# Anything that stops a file from taking the ``_AsciiFile`` path: non-ASCII bytes, or line
+# breaks other than ``\\n`` that ``str.splitlines`` also splits on.
+_NOT_PLAIN_ASCII_RE: Final = re.compile(rb"[^\x00-\x0a\x0e-\x1b\x1f-\x7f]")
+
+
+class _FileCache:
+    """LRU of loaded files bounded by the total size of the files, one entry per path.
+
+    An entry is reused only while the file's mtime and size are unchanged; a changed file
+    replaces its entry, so edited files are reloaded and their old copies are released.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[int, int, _LoadedFile | _AsciiFile]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, mtime_ns: int, size: int) -> _LoadedFile | _AsciiFile:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == (mtime_ns, size):
+                self._entries.move_to_end(path)
+                return entry[2]
+
+        loaded = _read_file(path, size)
+        with self._lock:
+            stale = self._entries.pop(path, None)
+            if stale is not None:
+                self._bytes -= stale[1]
+            if size <= self._max_bytes:
+                self._entries[path] = (mtime_ns, size, loaded)
+                self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+        return loaded
+
+
+_FILE_CACHE: Final = _FileCache(_FILE_CACHE_BYTES)
+
+
+def _load_file(path: str, mtime_ns: int, size: int) -> _LoadedFile | _AsciiFile:
+    """Return the searchable form of ``path``, reloading it once its mtime or size changes."""
+
+    return _FILE_CACHE.get(path, mtime_ns, size)
+
+
+def _read_file(path: str, size: int) -> _LoadedFile | _AsciiFile:
+    """Load and index a file for searching."""
+
+    if size == 0:
+        return _EMPTY_FILE
+    try:
+        with (
+            open(path, "rb") as handle,
+            mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            # Both the check and the decode read the mapping directly, without a bytes copy.
+            if _NOT_PLAIN_ASCII_RE.search(mapped) is None:
+                return _AsciiFile(path=path, folded=mapped[:].lower())
+            text = str(mapped, "utf-8", errors="ignore")
+    except (OSError, ValueError):
+        return _EMPTY_FILE
+
+    lines = tuple(text.splitlines())
+    folded_lines = [line.casefold() for line in lines]
+    line_starts = array("Q", accumulate((len(line) + 1 for line in folded_lines[:-1]), initial=0))
+    return _LoadedFile(lines=lines, folded="\n".join(folded_lines), line_starts=line_starts)
+
+
+# Search paths and file globs of one walk.
+_PathCacheKey = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+@dataclass(frozen=True, slots=True)
+class _Walk:
+    """A complete walk plus the mtime of every directory it listed (and of each root)."""
+
+    paths: tuple[Path, ...]
+    # Adding, removing or renaming an entry bumps its directory's mtime, so the walk is still
+    # accurate while none of these changed, however deep the change is.
+    stamps: tuple[tuple[str, int], ...]
+
+    def is_current(self) -> bool:
+        return all(_mtime_ns(path) == mtime_ns for path, mtime_ns in self.stamps)
+
+
+_PATH_CACHE: dict[_PathCacheKey, _Walk] = {}
+_PATH_CACHE_SIZE: Final = 32
+# Keys whose walk is being finished on the scan pool after a caller stopped early.
+_PENDING_WALKS: set[_PathCacheKey] = set()
+_PENDING_WALKS_LOCK: Final = threading.Lock()
+
+
+def _iter_candidate_paths(settings: RetrievalSettings) -> Iterator[Path]:
+    """Yield candidate files lazily, so a caller that stops early skips the rest of the walk.
+
+    A cached walk is replayed while the directories it listed are unchanged, which costs one
+    stat per directory instead of a listing. A caller that stops early leaves the rest of the
+    walk to the scan pool, so the cache fills even when searches end at ``max_results``.
+    """
+
+    key = (tuple(settings.search_paths), tuple(settings.file_globs))
+    cached = _PATH_CACHE.get(key)
+    if cached is not None and cached.is_current():
+        yield from cached.paths
+        return
+
+    walked: list[Path] = []
+    stamps: dict[str, int] = {}
+    finished = False
+    try:
+        for path in _walk(key, stamps):
+            walked.append(path)
+            yield path
+        finished = True
+    finally:
+        if finished:
+            _store_walk(key, _Walk(tuple(walked), tuple(stamps.items())))
+        else:
+            _finish_walk_in_background(key)
+
+
+def _walk(key: _PathCacheKey, stamps: dict[str, int]) -> Iterator[Path]:
+    search_paths, file_globs = key
+    seen: set[Path] = set()
+    for raw in search_paths:
+        for path in _expand_root(Path(raw).expanduser(), file_globs, stamps):
+            if path not in seen:
+                seen.add(path)
+                yield path
+
+
+def _store_walk(key: _PathCacheKey, walk: _Walk) -> None:
+    if key not in _PATH_CACHE and len(_PATH_CACHE) >= _PATH_CACHE_SIZE:
+        _PATH_CACHE.clear()
+    _PATH_CACHE[key] = walk
+
+
+def _finish_walk_in_background(key: _PathCacheKey) -> None:
+    with _PENDING_WALKS_LOCK:
+        if key in _PENDING_WALKS:
+            return
+        _PENDING_WALKS.add(key)
+    try:
+        _SCAN_EXECUTOR.submit(_cache_full_walk, key)
+    except RuntimeError:  # the pool is shutting down with the interpreter
+        with _PENDING_WALKS_LOCK:
+            _PENDING_WALKS.discard(key)
+
+
+def _cache_full_walk(key: _PathCacheKey) -> None:
+    try:
+        stamps: dict[str, int] = {}
+        paths = tuple(_walk(key, stamps))
+        _store_walk(key, _Walk(paths, tuple(stamps.items())))
+    finally:
+        with _PENDING_WALKS_LOCK:
+            _PENDING_WALKS.discard(key)
+
+
+def _expand_root(root: Path, file_globs: Sequence[str], stamps: dict[str, int]) -> Iterator[Path]:
+    # Stamped before listing, so an entry added mid-walk still invalidates the cached walk.
+    stamps[str(root)] = _mtime_ns(str(root))
+    if root.is_file():
+        yield root
+        return
+    if not root.is_dir():
+        return
+    for pattern in file_globs:
+        recursive, name_pattern = _split_glob(pattern)
+        if name_pattern is None:
+            _stamp_tree(root, stamps)
+            yield from (path for path in root.glob(pattern) if path.is_file())
+        else:
+            yield from _scan_dir(root, name_pattern, stamps, recursive=recursive)
+
+
+def _split_glob(pattern: str) -> tuple[bool, str | None]:
+    """Split ``**/<name>`` or ``<name>`` patterns; ``None`` means fall back to ``Path.glob``."""
+
+    recursive = pattern.startswith("**/")
+    name_pattern = pattern[3:] if recursive else pattern
+    if "/" in name_pattern or "**" in name_pattern:
+        return False, None
+    return recursive, name_pattern
+
+
+def _scan_dir(
+    directory: Path, name_pattern: str, stamps: dict[str, int], *, recursive: bool
+) -> Iterator[Path]:
+    # scandir reports entry types from the directory listing itself, so matching files and
+    # descending into subdirectories needs no per-file stat.
+    stamps[str(directory)] = _mtime_ns(str(directory))
+    subdirectories: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        if fnmatch.fnmatchcase(entry.name, name_pattern):
+                            yield Path(entry.path)
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return
+    for subdirectory in subdirectories:
+        yield from _scan_dir(Path(subdirectory), name_pattern, stamps, recursive=True)
+
+
+def _stamp_tree(directory: Path, stamps: dict[str, int]) -> None:
+    """Stamp every directory under ``directory``; ``Path.glob`` does not report what it listed."""
+
+    stamps[str(directory)] = _mtime_ns(str(directory))
+    try:
+        with os.scandir(directory) as entries:
+            subdirectories = [
+                entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return
+    for subdirectory in subdirectories:
+        _stamp_tree(Path(subdirectory), stamps)
+
+
+def _mtime_ns(path: str) -> int:
+    try:
+        return os.stat(os.path.expanduser(path)).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _take(paths: Iterator[Path], count: int) -> list[Path]:
+    return list(islice(paths, count))
+
+
+def _tokenize(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.casefold())
+
+
+@dataclass(slots=True)
+class _IndexedFile:
+    mtime_ns: int
+    size: int
+    lines: tuple[str, ...]
+    # token -> ascending indexes of the lines containing it
+    postings: dict[str, list[int]]
+
+
+class IndexedCorpus:
+    """Inverted token index over the retrieval corpus.
+
+    Maps each token to the files containing it and, per file, to the lines containing it, so a
+    multi-token query is a few set intersections instead of a scan of every file. ``refresh``
+    re-indexes only files whose mtime or size changed and drops files that disappeared.
+    """
+
+    def __init__(self, settings: RetrievalSettings) -> None:
+        self._settings = settings
+        self._files: dict[Path, _IndexedFile] = {}
+        self._files_by_token: defaultdict[str, set[Path]] = defaultdict(set)
+        self._order: dict[Path, int] = {}
+        self._lock = asyncio.Lock()
+
+    def refresh(self) -> None:
+        paths = tuple(_iter_candidate_paths(self._settings))
+        max_bytes = self._settings.max_file_size_kb * 1024
+        seen: set[Path] = set()
+        for path in paths:
+            try:
+                info = path.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(info.st_mode) or info.st_size > max_bytes:
+                continue
+            seen.add(path)
+            current = self._files.get(path)
+            if current and (current.mtime_ns, current.size) == (info.st_mtime_ns, info.st_size):
+                continue
+            self._drop(path)
+            self._add(path, info)
+
+        for path in self._files.keys() - seen:
+            self._drop(path)
+        self._order = {path: index for index, path in enumerate(paths)}
+
+    def search(self, tokens: Sequence[str], limit: int) -> list[tuple[Path, int, str]]:
+        """Return ``(path, line_no, line)`` for lines containing every token, in path order."""
+
+        # Rarest token first keeps the intermediate candidate sets small.
+        unique = sorted(set(tokens), key=lambda token: len(self._files_by_token.get(token, ())))
+        if not unique:
+            return []
+        candidates = set(self._files_by_token.get(unique[0], ()))
+        for token in unique[1:]:
+            candidates &= self._files_by_token.get(token, set())
+            if not candidates:
+                return []
+
+        results: list[tuple[Path, int, str]] = []
+        per_file = self._settings.max_results
+        for path in sorted(candidates, key=self._order.__getitem__):
+            indexed = self._files[path]
+            first, *rest = (indexed.postings[token] for token in unique)
+            lines = set(first).intersection(*rest)
+            for index in sorted(lines)[:per_file]:
+                results.append((path, index + 1, indexed.lines[index]))
+                if len(results) >= limit:
+                    return results
+        return results
+
+    async def query(self, tokens: Sequence[str], limit: int) -> list[tuple[Path, int, str]]:
+        """Refresh changed files and search, off the event loop and one query at a time."""
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            return await loop.run_in_executor(
+                _SCAN_EXECUTOR, self._refresh_and_search, tokens, limit
+            )
+
+    def _refresh_and_search(self, tokens: Sequence[str], limit: int) -> list[tuple[Path, int, str]]:
+        self.refresh()
+        return self.search(tokens, limit)
+
+    def _add(self, path: Path, info: os.stat_result) -> None:
+        try:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return
+        lines = tuple(text.splitlines())
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        for index, line in enumerate(lines):
+            for token in set(_tokenize(line)):
+                postings[token].append(index)
+        self._files[path] = _IndexedFile(
+            mtime_ns=info.st_mtime_ns, size=info.st_size, lines=lines, postings=dict(postings)
+        )
+        for token in postings:
+            self._files_by_token[token].add(path)
+
+    def _drop(self, path: Path) -> None:
+        indexed = self._files.pop(path, None)
+        if indexed is None:
+            return
+        for token in indexed.postings:
+            files = self._files_by_token[token]
+            files.discard(path)
+            if not files:
+                del self._files_by_token[token]
+
 
 @dataclass(slots=True)
 class RetrieveTool:
     """Search configured paths for a query string and return matching snippets."""
 
     settings: RetrievalSettings
+    corpus: IndexedCorpus | None = None
     spec: ToolSpec = field(
         default_factory=lambda: ToolSpec(
             name="retrieve",
@@ -40,63 +500,80 @@ class RetrieveTool:
         max_results = int(arguments.get("max_results") or self.settings.max_results)
         max_results = max(1, min(max_results, self.settings.max_results))
 
+        tokens = _tokenize(query)
         matches: list[dict[str, Any]] = []
-        for path in self._iter_paths():
-            for line_no, line in self._iter_matches(path, query):
-                matches.append(
-                    {
-                        "path": str(path),
-                        "line": line_no,
-                        "text": line,
-                    }
-                )
-                if len(matches) >= max_results:
-                    break
-            if len(matches) >= max_results:
-                break
-
+        if self.corpus is not None and len(set(tokens)) > 1:
+            # Multi-token queries match lines containing every token, in any order.
+            hits = await self.corpus.query(tokens, max_results)
+            matches = [
+                {"path": str(path), "line": line_no, "text": self._snippet(line)}
+                for path, line_no, line in hits
+            ]
+        if not matches:
+            # The index only knows whole tokens; partial words such as "seat bel" still match
+            # as a substring.
+            matches = await self._collect_matches(query, max_results)
         payload = {"query": query, "matches": matches}
-        content = json.dumps(payload, ensure_ascii=True)
-        return ToolResult.from_data(self.spec.name, payload, content=content)
-
-    def _iter_paths(self) -> list[Path]:
-        roots = [Path(path).expanduser() for path in self.settings.search_paths]
-        paths: list[Path] = []
-        for root in roots:
-            if root.is_file():
-                paths.append(root)
-                continue
-            if not root.exists():
-                continue
-            for pattern in self.settings.file_globs:
-                paths.extend(root.glob(pattern))
+        return ToolResult.from_data(self.spec.name, payload, ascii_only=self.spec.ascii_only)
 
-        max_bytes = self.settings.max_file_size_kb * 1024
-        filtered: list[Path] = []
-        for path in paths:
-            if not path.is_file():
-                continue
-            try:
-                if path.stat().st_size > max_bytes:
-                    continue
-            except OSError:
-                continue
-            filtered.append(path)
-        return filtered
+    async def _collect_matches(self, query: str, max_results: int) -> list[dict[str, Any]]:
+        """Scan candidate files on the shared pool, keeping results in path order.
+
+        Up to ``_SCAN_WORKERS`` files are scanned ahead of the one being consumed; scans still
+        queued once ``max_results`` matches are found are cancelled.
+        """
+
+        loop = asyncio.get_running_loop()
+        paths = self._iter_paths()
+        queued: deque[Path] = deque()
+        in_flight: deque[tuple[Path, asyncio.Future[list[tuple[int, str]]]]] = deque()
+
+        async def schedule() -> None:
+            while len(in_flight) < _SCAN_WORKERS:
+                if not queued:
+                    # Advance the lazy walk off the event loop, a batch at a time.
+                    batch = await loop.run_in_executor(_SCAN_EXECUTOR, _take, paths, _SCAN_WORKERS)
+                    if not batch:
+                        return
+                    queued.extend(batch)
+                path = queued.popleft()
+                scan = loop.run_in_executor(_SCAN_EXECUTOR, self._iter_matches, path, query)
+                in_flight.append((path, scan))
+
+        matches: list[dict[str, Any]] = []
+        try:
+            await schedule()
+            while in_flight:
+                path, scan = in_flight.popleft()
+                for line_no, line in await scan:
+                    matches.append({"path": str(path), "line": line_no, "text": line})
+                    if len(matches) >= max_results:
+                        return matches
+                await schedule()
+        finally:
+            for _, scan in in_flight:
+                scan.cancel()
+        return matches
+
+    def _iter_paths(self) -> Iterator[Path]:
+        return _iter_candidate_paths(self.settings)
+
+    def _snippet(self, line: str) -> str:
+        snippet = line.strip()
+        if len(snippet) > self.settings.max_snippet_chars:
+            snippet = snippet[: self.settings.max_snippet_chars].rstrip()
+        return snippet
 
     def _iter_matches(self, path: Path, query: str) -> list[tuple[int, str]]:
-        query_lower = query.casefold()
         matches: list[tuple[int, str]] = []
         try:
-            lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+            info = path.stat()
         except OSError:
             return matches
-        for idx, line in enumerate(lines, start=1):
-            if query_lower in line.casefold():
-                snippet = line.strip()
-                if len(snippet) > self.settings.max_snippet_chars:
-                    snippet = snippet[: self.settings.max_snippet_chars].rstrip()
-                matches.append((idx, snippet))
-                if len(matches) >= self.settings.max_results:
-                    break
+        if not stat.S_ISREG(info.st_mode) or info.st_size > self.settings.max_file_size_kb * 1024:
+            return matches
+
+        loaded = _load_file(str(path), info.st_mtime_ns, info.st_size)
+        for line_no, line in loaded.find_lines(query.casefold(), self.settings.max_results):
+            matches.append((line_no, self._snippet(line)))
         return matches
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from exec_agent.tools.base import ToolSpec
 
@@ -11,9 +11,12 @@ from exec_agent.tools.base import ToolSpec
 class ToolAuthContext:
     """Authorization context for filtering tools."""
 
-    scopes: set[str] = field(default_factory=set)
+    scopes: frozenset[str] = frozenset()
     user_id: str | None = None
 
+    def __post_init__(self) -> None:
+        self.scopes = frozenset(self.scopes)
+
 
 @dataclass(slots=True)
 class ToolPolicyDecision:
@@ -27,10 +30,17 @@ class ToolPolicyDecision:
 class ToolPolicy:
     """Simple allow/deny policy with call limits and scope checks."""
 
-    allowed_tools: set[str] | None = None
-    denied_tools: set[str] = field(default_factory=set)
+    allowed_tools: frozenset[str] | None = None
+    denied_tools: frozenset[str] = frozenset()
     max_calls: int = 8
 
+    def __post_init__(self) -> None:
+        # Frozen copies: membership checks run per tool call, and the caller's sets can't
+        # change the policy afterwards.
+        if self.allowed_tools is not None:
+            self.allowed_tools = frozenset(self.allowed_tools)
+        self.denied_tools = frozenset(self.denied_tools)
+
     def evaluate(
         self,
         spec: ToolSpec,
@@ -47,6 +57,6 @@ class ToolPolicy:
         if spec.scopes:
             if auth is None:
                 return ToolPolicyDecision(allow=False, reason="missing_auth_context")
-            if not (set(spec.scopes) & auth.scopes):
+            if spec.scopes.isdisjoint(auth.scopes):
                 return ToolPolicyDecision(allow=False, reason="missing_required_scope")
         return ToolPolicyDecision(allow=True)
@@ -4,22 +4,31 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from dataclasses import dataclass, field
+from typing import Final
 
 from exec_agent.tools.base import Tool, ToolSpec
 from exec_agent.tools.policies import ToolAuthContext
 
+# Scope sets come from callers, so the per-scope spec cache is capped.
+_SPEC_CACHE_SIZE: Final = 64
+
 
 @dataclass(slots=True)
 class ToolRegistry:
     """Registry for available tools with optional scope filtering."""
 
     _tools: dict[str, Tool] = field(default_factory=dict)
+    # Spec lists per scope set; cleared on every registration so stale lists are never reused.
+    _spec_cache: dict[frozenset[str], tuple[ToolSpec, ...]] = field(
+        default_factory=dict, repr=False
+    )
 
     def register(self, tool: Tool) -> None:
         name = tool.spec.name
         if name in self._tools:
             raise ValueError(f"Tool already registered: {name}")
         self._tools[name] = tool
+        self._spec_cache.clear()
 
     def register_all(self, tools: Iterable[Tool]) -> None:
         for tool in tools:
@@ -28,8 +37,16 @@ class ToolRegistry:
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
 
-    def list_specs(self, auth: ToolAuthContext | None = None) -> list[ToolSpec]:
-        specs = [tool.spec for tool in self._tools.values()]
-        if auth is None or not auth.scopes:
-            return [spec for spec in specs if not spec.scopes]
-        return [spec for spec in specs if not spec.scopes or set(spec.scopes) & auth.scopes]
+    def list_specs(self, auth: ToolAuthContext | None = None) -> tuple[ToolSpec, ...]:
+        scopes = auth.scopes if auth is not None else frozenset()
+        specs = self._spec_cache.get(scopes)
+        if specs is None:
+            specs = tuple(
+                tool.spec
+                for tool in self._tools.values()
+                if not tool.spec.scopes or not scopes.isdisjoint(tool.spec.scopes)
+            )
+            if len(self._spec_cache) >= _SPEC_CACHE_SIZE:
+                self._spec_cache.clear()
+            self._spec_cache[scopes] = specs
+        return specs
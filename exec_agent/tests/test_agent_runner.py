@@ -3,14 +3,28 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any
 
-from exec_agent.agent.runner import AgentRunner
-from exec_agent.agent.types import ModelResponse, ToolCall
+import httpx
+import litellm
+import pytest
+import structlog.testing
+from tenacity import wait_none
+
+from exec_agent.agent import runner as runner_module
+from exec_agent.agent.runner import (
+    AgentRunner,
+    LiteLLMChatClient,
+    _coerce_text_chunks,
+    _extract_response_payload,
+    create_http_client,
+)
+from exec_agent.agent.types import ChatMessage, Conversation, ModelResponse, ToolCall
 from exec_agent.tools.base import ToolResult, ToolSpec
 from exec_agent.tools.executor import ToolExecutor
-from exec_agent.tools.policies import ToolPolicy
-from exec_agent.tools.registry import ToolRegistry
+from exec_agent.tools.policies import ToolAuthContext, ToolPolicy
+from exec_agent.tools.registry import _SPEC_CACHE_SIZE, ToolRegistry
 
 
 @dataclass(slots=True)
@@ -67,3 +81,291 @@ def test_agent_run_with_tool_call() -> None:
     assert result.steps == 2
     assert result.tool_calls_executed == 1
     assert tool.seen_args == [{"query": "hello"}]
+
+
+def test_extract_response_payload_from_dicts_and_objects() -> None:
+    as_dict = {
+        "output": [
+            {
+                "type": "message",
+                "content": [
+                    {"type": "output_text", "text": "hello "},
+                    {"type": "output_text", "text": {"value": "world"}},
+                ],
+            },
+            {"type": "function_call", "call_id": "c1", "name": "retrieve", "arguments": "{}"},
+        ]
+    }
+    as_object = SimpleNamespace(
+        output=[
+            SimpleNamespace(
+                type="message",
+                content=[
+                    SimpleNamespace(type="output_text", text="hello "),
+                    SimpleNamespace(type="output_text", text={"value": "world"}),
+                ],
+            ),
+            SimpleNamespace(type="function_call", call_id="c1", name="retrieve", arguments="{}"),
+        ]
+    )
+
+    for response in (as_dict, as_object):
+        text, tool_calls = _extract_response_payload(response)
+
+        assert text == "hello world"
+        assert [(call.id, call.name, call.arguments) for call in tool_calls] == [
+            ("c1", "retrieve", {})
+        ]
+
+
+def test_client_falls_back_to_chat_once_per_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    async def fake_aresponses(**_: Any) -> dict[str, Any]:
+        calls.append("responses")
+        return {"output": []}
+
+    async def fake_acompletion(**_: Any) -> dict[str, Any]:
+        calls.append("chat")
+        return {"choices": [{"message": {"content": "hi"}}]}
+
+    monkeypatch.setattr(runner_module, "aresponses", fake_aresponses)
+    monkeypatch.setattr(runner_module, "acompletion", fake_acompletion)
+    monkeypatch.setattr(runner_module, "_API_BY_MODEL", {})
+
+    messages = [ChatMessage(role="user", content="hello")]
+    client = LiteLLMChatClient(model="custom/model", temperature=0.0, timeout_seconds=5)
+    first = asyncio.run(client.complete(messages, []))
+    second = asyncio.run(client.complete(messages, []))
+    fresh = LiteLLMChatClient(model="custom/model", temperature=0.0, timeout_seconds=5)
+    third = asyncio.run(fresh.complete(messages, []))
+
+    assert [first.text, second.text, third.text] == ["hi", "hi", "hi"]
+    assert calls == ["responses", "chat", "chat", "chat"]
+
+
+def test_coerce_text_chunks_preserves_nested_order() -> None:
+    value = [
+        "a",
+        {"content": [{"text": "b"}, [{"value": "c"}, SimpleNamespace(text={"text": "d"})]]},
+        {"text": {"value": "e"}},
+        "",
+        None,
+        ["f"],
+    ]
+
+    assert _coerce_text_chunks(value) == ["a", "b", "c", "d", "e", "f"]
+
+
+def test_conversation_extends_payloads_incrementally() -> None:
+    conversation = Conversation([ChatMessage(role="user", content="hi")])
+    first = conversation.responses_inputs()
+
+    call = ToolCall(id="c1", name="retrieve", arguments={"query": "hi"})
+    conversation.append(ChatMessage(role="assistant", tool_calls=[call]))
+    conversation.append(ChatMessage(role="tool", content="ok", tool_call_id="c1"))
+    second = conversation.responses_inputs()
+
+    assert [item["role"] for item in first] == ["user"]
+    assert [item.get("type", item.get("role")) for item in second] == [
+        "user",
+        "function_call",
+        "function_call_output",
+    ]
+    assert [message["role"] for message in conversation.chat_messages()] == [
+        "user",
+        "assistant",
+        "tool",
+    ]
+
+    second.clear()
+    conversation.messages[0].to_responses_inputs().clear()
+    assert len(conversation.responses_inputs()) == 3
+    assert len(conversation.messages[0].to_responses_inputs()) == 1
+
+
+def test_tool_executor_runs_calls_concurrently_in_order() -> None:
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    @dataclass(slots=True)
+    class WaitingTool:
+        spec: ToolSpec
+
+        async def run(self, arguments: Mapping[str, Any]) -> ToolResult:
+            started.append(arguments["query"])
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return ToolResult.from_data(self.spec.name, {"query": arguments["query"]})
+
+    registry = ToolRegistry()
+    registry.register(WaitingTool(spec=ToolSpec(name="retrieve", description="", input_schema={})))
+    executor = ToolExecutor(registry, ToolPolicy(max_calls=3))
+    calls = [
+        ToolCall(id="c1", name="retrieve", arguments={"query": "a"}),
+        ToolCall(id="c2", name="missing", arguments={}),
+        ToolCall(id="c3", name="retrieve", arguments={"query": "b"}),
+    ]
+
+    summary = asyncio.run(executor.execute(calls, auth=None))
+
+    assert summary.call_count == 3
+    assert [result.ok for result in summary.results] == [True, False, True]
+    assert [result.data for result in summary.results] == [{"query": "a"}, None, {"query": "b"}]
+
+
+def test_registry_caches_specs_per_scope_set() -> None:
+    public = RecordingTool(spec=ToolSpec(name="public", description="", input_schema={}))
+    scoped = RecordingTool(
+        spec=ToolSpec(name="scoped", description="", input_schema={}, scopes=["admin"])
+    )
+    registry = ToolRegistry()
+    registry.register(public)
+
+    first = registry.list_specs()
+    assert registry.list_specs() is first
+    assert [spec.name for spec in first] == ["public"]
+
+    registry.register(scoped)
+    admin = ToolAuthContext(scopes={"admin"})
+    assert [spec.name for spec in registry.list_specs()] == ["public"]
+    assert [spec.name for spec in registry.list_specs(admin)] == ["public", "scoped"]
+
+    for index in range(200):
+        registry.list_specs(ToolAuthContext(scopes={f"scope-{index}"}))
+    assert len(registry._spec_cache) <= _SPEC_CACHE_SIZE
+
+
+def test_policy_checks_scopes_against_frozen_sets() -> None:
+    spec = ToolSpec(name="scoped", description="", input_schema={}, scopes=["admin", "ops"])
+    allowed = {"scoped"}
+    policy = ToolPolicy(allowed_tools=allowed, max_calls=2)
+    allowed.clear()
+
+    assert spec.scopes == frozenset({"admin", "ops"})
+    assert policy.evaluate(spec, ToolAuthContext(scopes={"ops"}), call_count=0).allow
+    denied = policy.evaluate(spec, ToolAuthContext(scopes={"guest"}), call_count=0)
+    assert denied.reason == "missing_required_scope"
+    assert policy.evaluate(spec, None, call_count=0).reason == "missing_auth_context"
+
+
+def test_tool_result_escapes_only_for_ascii_only_specs() -> None:
+    data = {"text": "naïve 検索 🙂", "n": 1}
+
+    assert ToolResult.from_data("t", data).content == '{"text":"naïve 検索 🙂","n":1}'
+    escaped = ToolResult.from_data("t", data, ascii_only=True).content
+    assert escaped.isascii()
+    assert escaped == '{"text":"na\\u00efve \\u691c\\u7d22 \\ud83d\\ude42","n":1}'
+
+
+def test_tool_executor_logs_debug_events_when_enabled() -> None:
+    tool = RecordingTool(spec=ToolSpec(name="retrieve", description="", input_schema={}))
+    registry = ToolRegistry()
+    registry.register(tool)
+    executor = ToolExecutor(registry, ToolPolicy(max_calls=1))
+    call = ToolCall(id="c1", name="retrieve", arguments={"query": "hi"})
+
+    with structlog.testing.capture_logs() as logs:
+        asyncio.run(executor.execute([call], auth=None))
+
+    events = [(entry["event"], entry["log_level"]) for entry in logs]
+    assert events == [("tool.execute_start", "debug"), ("tool.execute_end", "debug")]
+    assert logs[0]["arg_keys"] == ["query"]
+
+
+def test_client_sends_responses_calls_through_the_shared_http_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    requests: list[httpx.Request] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={
+                "id": "resp_1",
+                "object": "response",
+                "created_at": 0,
+                "status": "completed",
+                "model": "gpt-4.1-mini",
+                "output": [
+                    {
+                        "type": "message",
+                        "id": "m1",
+                        "status": "completed",
+                        "role": "assistant",
+                        "content": [{"type": "output_text", "text": "hi", "annotations": []}],
+                    }
+                ],
+                "parallel_tool_calls": True,
+                "tool_choice": "auto",
+                "tools": [],
+            },
+        )
+
+    async def scenario() -> ModelResponse:
+        shared = create_http_client(timeout_seconds=5)
+        assert shared.headers["User-Agent"].startswith("litellm/")
+        await shared.aclose()
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(respond)) as shared:
+            client = LiteLLMChatClient(
+                model="openai/gpt-4.1-mini", temperature=0.0, timeout_seconds=5
+            )
+            await client.use_http_client(shared)
+            return await client.complete([ChatMessage(role="user", content="hello")], [])
+
+    response = asyncio.run(scenario())
+
+    assert response.text == "hi"
+    assert [str(request.url) for request in requests] == ["https://api.openai.com/v1/responses"]
+
+
+def test_client_retries_transient_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    attempts: list[int] = []
+
+    async def flaky_acompletion(**_: Any) -> dict[str, Any]:
+        attempts.append(len(attempts) + 1)
+        if len(attempts) < 3:
+            raise litellm.RateLimitError("slow down", llm_provider="anthropic", model="m")
+        return {"choices": [{"message": {"content": "done"}}]}
+
+    monkeypatch.setattr(runner_module, "acompletion", flaky_acompletion)
+    monkeypatch.setattr(runner_module, "_RETRY_WAIT", wait_none())
+    client = LiteLLMChatClient(
+        model="anthropic/claude", temperature=0.0, timeout_seconds=5, max_attempts=3
+    )
+
+    response = asyncio.run(client.complete([ChatMessage(role="user", content="hi")], []))
+
+    assert response.text == "done"
+    assert attempts == [1, 2, 3]
+
+
+def test_client_caps_concurrent_model_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def slow_acompletion(**_: Any) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"choices": [{"message": {"content": "ok"}}]}
+
+    monkeypatch.setattr(runner_module, "acompletion", slow_acompletion)
+
+    async def scenario() -> list[ModelResponse]:
+        client = LiteLLMChatClient(
+            model="anthropic/claude", temperature=0.0, timeout_seconds=5, max_concurrency=2
+        )
+        messages = [ChatMessage(role="user", content="hi")]
+        return await asyncio.gather(*(client.complete(messages, []) for _ in range(6)))
+
+    responses = asyncio.run(scenario())
+
+    assert [response.text for response in responses] == ["ok"] * 6
+    assert peak == 2
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import dataclasses
 import os
 from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
 
+import litellm
 import pytest
 from core.cmd_utils import load_app_settings
 from fastapi.testclient import TestClient
 
-from exec_agent.app import AppSettings, create_app
+from exec_agent.app import AppSettings, _rate_limit_response, create_app
 
 
 def test_app_settings_defaults() -> None:
@@ -21,6 +24,7 @@ def test_app_settings_defaults() -> None:
     assert settings.reload is False
     assert settings.service_name == "app-template"
     assert settings.metadata == {}
+    assert settings.response_cache.enabled is False
 
 
 def test_load_app_settings_with_env(tmp_path: Path) -> None:
@@ -77,3 +81,61 @@ def test_ping_endpoint(client: TestClient) -> None:
     response = client.get("/v1/ping")
     assert response.status_code == 200
     assert response.json() == {"message": "pong", "service": "app-template"}
+
+
+def test_rate_limit_response_reads_retry_delay() -> None:
+    message = 'RateLimitError: {"error": {"details": [{"retryDelay": "12.5s"}]}}'
+
+    detail, headers = _rate_limit_response(Exception(message))
+
+    assert headers == {"Retry-After": "13"}
+    assert detail.endswith("Retry after 13 seconds.")
+
+
+def test_rate_limit_response_prefers_structured_retry_after() -> None:
+    exc = Exception('"retryDelay": "30s"')
+    exc.retry_after = 2  # type: ignore[attr-defined]
+
+    _, headers = _rate_limit_response(exc)
+
+    assert headers == {"Retry-After": "2"}
+
+
+def test_lifespan_shares_one_pooled_http_client(default_config_path: Path) -> None:
+    settings = load_app_settings(AppSettings, ["--config", str(default_config_path)])
+    app = create_app(settings)
+
+    with TestClient(app):
+        http_client = app.state.http_client
+        assert litellm.aclient_session is http_client
+        assert not http_client.is_closed
+
+    assert http_client.is_closed
+    assert litellm.aclient_session is None
+
+
+def test_query_returns_503_when_backend_slots_are_busy(default_config_path: Path) -> None:
+    settings = load_app_settings(AppSettings, ["--config", str(default_config_path)])
+    settings = dataclasses.replace(
+        settings, backend_concurrency=0, backend_acquire_timeout_seconds=0.01
+    )
+    app = create_app(settings)
+
+    with TestClient(app) as test_client:
+        response = test_client.post("/v1/query", json={"user_input": "hello"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_query_returns_agent_output(client: TestClient) -> None:
+    class StubRunner:
+        async def run(self, user_input: str) -> SimpleNamespace:
+            return SimpleNamespace(output=f"echo: {user_input}")
+
+    client.app.state.agent_runner = StubRunner()  # type: ignore[attr-defined]
+
+    response = client.post("/v1/query", json={"user_input": "hello"})
+
+    assert response.status_code == 200
+    assert response.json() == {"response": "echo: hello"}
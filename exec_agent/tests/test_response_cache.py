@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+from exec_agent.agent.cache import SemanticCache
+
+_VECTORS = {
+    "how do I check a seatbelt": [1.0, 0.0, 0.0],
+    "how to inspect a seat belt": [0.98, 0.2, 0.0],
+    "what is the weather": [0.0, 0.0, 1.0],
+}
+
+
+async def _embed(text: str) -> Sequence[float]:
+    return _VECTORS[text]
+
+
+def _run(cache: SemanticCache, query: str, answers: list[str]) -> str:
+    async def compute() -> str:
+        return answers.pop(0)
+
+    return asyncio.run(cache.get_or_compute(query, compute))
+
+
+def test_cache_serves_exact_and_similar_queries() -> None:
+    cache = SemanticCache(embed=_embed)
+    answers = ["buckle it", "sunny", "unused"]
+
+    assert _run(cache, "how do I check a seatbelt", answers) == "buckle it"
+    assert _run(cache, "how do I check a seatbelt", answers) == "buckle it"
+    assert _run(cache, "how to inspect a seat belt", answers) == "buckle it"
+    assert _run(cache, "what is the weather", answers) == "sunny"
+    assert answers == ["unused"]
+
+
+def test_cache_skips_empty_answers_and_expires_entries() -> None:
+    now = [100.0]
+    cache = SemanticCache(ttl_seconds=10, clock=lambda: now[0])
+    answers = ["", "first", "second"]
+
+    assert _run(cache, "q", answers) == ""
+    assert _run(cache, "q", answers) == "first"
+    now[0] += 10
+    assert _run(cache, "q", answers) == "first"
+    now[0] += 0.5
+    assert _run(cache, "q", answers) == "second"
+
+
+def test_similar_hits_keep_the_original_expiry() -> None:
+    now = [0.0]
+    cache = SemanticCache(ttl_seconds=10, embed=_embed, clock=lambda: now[0])
+    answers = ["buckle it", "fresh"]
+
+    assert _run(cache, "how do I check a seatbelt", answers) == "buckle it"
+    now[0] = 8
+    assert _run(cache, "how to inspect a seat belt", answers) == "buckle it"
+    now[0] = 18
+    assert _run(cache, "how to inspect a seat belt", answers) == "fresh"
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+from exec_agent.infra.config import RetrievalSettings
+from exec_agent.tools.impl.retrieve import (
+    _PATH_CACHE,
+    IndexedCorpus,
+    RetrieveTool,
+    _FileCache,
+    _iter_candidate_paths,
+)
+
+
+def _tool(tmp_path: Path, **overrides: object) -> RetrieveTool:
+    settings = RetrievalSettings(search_paths=[str(tmp_path)], **overrides)
+    return RetrieveTool(settings)
+
+
+def _matches(tool: RetrieveTool, query: str) -> list[tuple[str, int, str]]:
+    result = asyncio.run(tool.run({"query": query}))
+    assert result.ok
+    return [(Path(m["path"]).name, m["line"], m["text"]) for m in result.data["matches"]]
+
+
+def test_retrieve_finds_case_insensitive_matches(tmp_path: Path) -> None:
+    (tmp_path / "notes.md").write_text("intro\n  Seatbelt checks  \nother\nSEATBELT again\n")
+    (tmp_path / "skip.py").write_text("seatbelt in an unmatched glob\n")
+
+    assert _matches(_tool(tmp_path), "seatbelt") == [
+        ("notes.md", 2, "Seatbelt checks"),
+        ("notes.md", 4, "SEATBELT again"),
+    ]
+
+
+def test_retrieve_sees_edited_and_new_files(tmp_path: Path) -> None:
+    notes = tmp_path / "notes.md"
+    notes.write_text("alpha\n")
+    tool = _tool(tmp_path)
+    assert _matches(tool, "beta") == []
+
+    notes.write_text("alpha\nbeta\n")
+    stamp = notes.stat().st_mtime_ns + 1_000_000_000
+    os.utime(notes, ns=(stamp, stamp))
+    (tmp_path / "more.txt").write_text("beta too\n")
+    os.utime(tmp_path, ns=(stamp, stamp))
+
+    assert sorted(_matches(tool, "beta")) == [("more.txt", 1, "beta too"), ("notes.md", 2, "beta")]
+
+
+def test_retrieve_respects_limits(tmp_path: Path) -> None:
+    (tmp_path / "big.txt").write_text("x" * 4096 + "\n")
+    (tmp_path / "many.txt").write_text("hit " + "y" * 50 + "\n" + "hit\n" * 10)
+    tool = _tool(tmp_path, max_results=3, max_snippet_chars=10, max_file_size_kb=1)
+
+    assert _matches(tool, "hit") == [
+        ("many.txt", 1, "hit yyyyyy"),
+        ("many.txt", 2, "hit"),
+        ("many.txt", 3, "hit"),
+    ]
+    assert _matches(tool, "xxx") == []
+
+
+def test_retrieve_maps_hits_to_lines_when_casefold_changes_length(tmp_path: Path) -> None:
+    (tmp_path / "de.txt").write_text("Große Straße hit\nsecond hit hit\n\nthird HIT\n")
+
+    assert _matches(_tool(tmp_path), "hit") == [
+        ("de.txt", 1, "Große Straße hit"),
+        ("de.txt", 2, "second hit hit"),
+        ("de.txt", 4, "third HIT"),
+    ]
+    assert _matches(_tool(tmp_path), "strasse") == [("de.txt", 1, "Große Straße hit")]
+
+
+def test_retrieve_keeps_path_order_across_parallel_scans(tmp_path: Path) -> None:
+    for idx in range(40):
+        (tmp_path / f"doc-{idx:02d}.txt").write_text("filler\n" * idx + "needle\n")
+    tool = _tool(tmp_path, max_results=5, file_globs=["doc-*.txt"])
+
+    found = _matches(tool, "needle")
+
+    expected = list(tool._iter_paths())[:5]
+    assert [name for name, _, _ in found] == [path.name for path in expected]
+
+
+def test_indexed_corpus_answers_multi_token_queries(tmp_path: Path) -> None:
+    notes = tmp_path / "notes.md"
+    notes.write_text("Check the belt of each seat\nseat only\nInspect seat-belt buckles\n")
+    settings = RetrievalSettings(search_paths=[str(tmp_path)])
+    corpus = IndexedCorpus(settings)
+    corpus.refresh()
+    tool = RetrieveTool(settings, corpus=corpus)
+
+    assert _matches(tool, "seat belt") == [
+        ("notes.md", 1, "Check the belt of each seat"),
+        ("notes.md", 3, "Inspect seat-belt buckles"),
+    ]
+
+    notes.write_text("nothing relevant\n")
+    stamp = notes.stat().st_mtime_ns + 1_000_000_000
+    os.utime(notes, ns=(stamp, stamp))
+
+    assert _matches(tool, "seat belt") == []
+
+
+def test_indexed_retrieval_falls_back_to_substrings_for_partial_tokens(tmp_path: Path) -> None:
+    (tmp_path / "notes.md").write_text("Seat belt checks\nbelt only\n")
+    settings = RetrievalSettings(search_paths=[str(tmp_path)])
+    corpus = IndexedCorpus(settings)
+    corpus.refresh()
+    tool = RetrieveTool(settings, corpus=corpus)
+
+    assert _matches(tool, "seat bel") == [("notes.md", 1, "Seat belt checks")]
+
+
+def test_retrieve_walks_nested_directories_and_fallback_globs(tmp_path: Path) -> None:
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "deep.md").write_text("needle deep\n")
+    (tmp_path / "a" / "mid.txt").write_text("needle mid\n")
+    (tmp_path / "a" / "skip.rst").write_text("needle skipped\n")
+    (tmp_path / "top.md").write_text("needle top\n")
+    tool = _tool(tmp_path, file_globs=["**/*.md", "a/*.txt"])
+
+    assert sorted(_matches(tool, "needle")) == [
+        ("deep.md", 1, "needle deep"),
+        ("mid.txt", 1, "needle mid"),
+        ("top.md", 1, "needle top"),
+    ]
+
+
+def test_retrieve_sees_files_added_in_nested_directories(tmp_path: Path) -> None:
+    deep = tmp_path / "a" / "b"
+    deep.mkdir(parents=True)
+    (deep / "old.md").write_text("alpha\n")
+    tool = _tool(tmp_path)
+    assert _matches(tool, "gamma") == []
+
+    (deep / "new.md").write_text("gamma\n")
+    stamp = deep.stat().st_mtime_ns + 1_000_000_000
+    os.utime(deep, ns=(stamp, stamp))
+
+    assert _matches(tool, "gamma") == [("new.md", 1, "gamma")]
+
+
+def test_early_stopped_walk_still_fills_the_path_cache(tmp_path: Path) -> None:
+    for index in range(5):
+        (tmp_path / f"{index}.md").write_text("hit\n")
+    settings = RetrievalSettings(search_paths=[str(tmp_path)])
+    key = (tuple(settings.search_paths), tuple(settings.file_globs))
+
+    paths = _iter_candidate_paths(settings)
+    next(paths)
+    paths.close()
+
+    deadline = time.monotonic() + 5
+    while key not in _PATH_CACHE and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(_PATH_CACHE[key].paths) == 5
+
+
+def test_retrieve_scans_ascii_files_as_bytes(tmp_path: Path) -> None:
+    (tmp_path / "crlf.txt").write_bytes(b"Intro\r\nfirst NEEDLE here\r\n\r\nneedle needle\r\nlast")
+    (tmp_path / "empty.txt").write_bytes(b"")
+
+    assert _matches(_tool(tmp_path), "Needle") == [
+        ("crlf.txt", 2, "first NEEDLE here"),
+        ("crlf.txt", 4, "needle needle"),
+    ]
+    assert _matches(_tool(tmp_path), "last") == [("crlf.txt", 5, "last")]
+
+
+def test_retrieve_numbers_lines_like_splitlines(tmp_path: Path) -> None:
+    text = "page one\fneedle a\x0bneedle b\rneedle c\r\n\x1cNeedle d\nplain\n"
+    (tmp_path / "breaks.txt").write_bytes(text.encode("ascii"))
+
+    expected = [
+        ("breaks.txt", number, line)
+        for number, line in enumerate(text.splitlines(), start=1)
+        if "needle" in line.casefold()
+    ]
+    assert _matches(_tool(tmp_path), "needle") == expected
+    assert [line_no for _, line_no, _ in expected] == [2, 3, 4, 6]
+
+
+def test_file_cache_is_bounded_by_bytes_and_drops_edited_versions(tmp_path: Path) -> None:
+    cache = _FileCache(max_bytes=10)
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("one\n")
+    second.write_text("two two\n")
+
+    loaded = cache.get(str(first), 1, 4)
+    assert cache.get(str(first), 1, 4) is loaded
+    first.write_text("uno\n")
+    assert cache.get(str(first), 2, 4).find_lines("uno", 1) == [(1, "uno")]
+    assert list(cache._entries) == [str(first)]
+
+    cache.get(str(second), 1, 8)
+    assert list(cache._entries) == [str(second)]
+    assert cache._bytes == 8